@@ -1,3 +1,32 @@
 """NetMon - Network Monitoring Desktop Application."""
 
+import importlib
+
 __version__ = "0.1.0"
+
+# Submodules resolved on first attribute access (PEP 562), so that
+# ``import netmon`` stays cheap and e.g. the fake-collector path never
+# loads collector_ping or Qt.
+_SUBMODULES = frozenset(
+    {
+        "collector",
+        "collector_ping",
+        "fake_collector",
+        "host_stats",
+        "logging_config",
+        "models",
+        "scheduler",
+        "ui",
+        "workers",
+    }
+)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
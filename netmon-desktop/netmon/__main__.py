@@ -3,18 +3,25 @@
 import logging
 import os
 import sys
-from PySide6.QtWidgets import QApplication
-from netmon.collector import FakeCollectorAdapter
 from netmon.logging_config import configure_logging
-from netmon.ui.main_window import MainWindow
 
 # Configure logging early
 configure_logging()
 logger = logging.getLogger(__name__)
 
 
+def _force_fake() -> bool:
+    """Return True if NETMON_COLLECTOR=fake is set."""
+    return os.environ.get("NETMON_COLLECTOR", "").lower() == "fake"
+
+
 def main():
     """Main entry point for the NetMon application."""
+    # Qt is imported here rather than at module level so importing
+    # netmon.__main__ (e.g. for the console script) stays cheap.
+    from PySide6.QtWidgets import QApplication
+    from netmon.ui.main_window import MainWindow
+
     app = QApplication(sys.argv)
 
     # Collector selection with fallback
@@ -23,7 +30,7 @@ def main():
     debug_info = None
 
     # Check for environment variable override
-    force_fake = os.environ.get("NETMON_COLLECTOR", "").lower() == "fake"
+    force_fake = _force_fake()
 
     if not force_fake:
         # Try to use PingCollector as default - separate import from instantiation
@@ -62,6 +69,8 @@ def main():
 
     # Fall back to FakeCollectorAdapter if needed
     if collector is None:
+        from netmon.collector import FakeCollectorAdapter
+
         collector = FakeCollectorAdapter()
         logger.info("Using FakeCollectorAdapter")
 
@@ -4,15 +4,38 @@ import logging
 import platform
 import re
 import subprocess
+from collections.abc import Callable
 from datetime import datetime
 from math import ceil
 
 from netmon.models import Measurement
 
-logger = logging.getLogger(__name__)
+try:
+    import icmplib
+except ImportError:  # Optional dependency - fall back to the system ping command
+    icmplib = None
 
+logger = logging.getLogger(__name__)
 
-def parse_ping_latency_ms(output: str) -> float | None:
+# Platform probe done once at import and shared by all collectors
+_SYSTEM = platform.system()
+
+# Compiled once at import; parse_ping_latency_ms runs once per ping sample.
+# Single pass over the output for both formats, captured as groups "op"
+# and "num":
+# - "time<Nms" (Windows fast response)
+# - "time=12.3 ms" or "time = 12 ms" (standard format)
+# Matched against lower-cased output, so no re.IGNORECASE is needed.
+_PING_PATTERN = r"time\s*(?P<op>[=<])\s*(?P<num>\d+(?:\.\d+)?)\s*ms"
+_PING_RE = re.compile(_PING_PATTERN)
+# Same pattern for raw subprocess output, which is parsed without decoding
+_PING_BYTES_RE = re.compile(_PING_PATTERN.encode("ascii"))
+# Latency scale by operator; "time<N" is interpreted as the midpoint N/2.
+# Keyed by both str and bytes since either kind of output is parsed.
+_OP_SCALE = {"=": 1.0, "<": 0.5, b"=": 1.0, b"<": 0.5}
+
+
+def parse_ping_latency_ms(output: str | bytes) -> float | None:
     """Parse latency value from ping command output (pure function).
 
     Handles various ping output formats across platforms:
@@ -21,12 +44,14 @@ def parse_ping_latency_ms(output: str) -> float | None:
 
     Windows "time<Nms" is interpreted as N/2 ms (midpoint estimate).
     For example, "time<1ms" => 0.5ms, "time<10ms" => 5.0ms.
+    If several latency tokens appear, the first one in the output wins.
 
     This is a pure function with no side effects, making it easily testable
     without requiring subprocess calls or OS-specific setup.
 
     Args:
-        output: Raw ping command output (stdout or combined stdout+stderr)
+        output: Raw ping command output (stdout or combined stdout+stderr),
+                either decoded or as the bytes captured from the process
 
     Returns:
         Latency in milliseconds (float), or None if parsing failed
@@ -42,34 +67,39 @@ def parse_ping_latency_ms(output: str) -> float | None:
     if not output:
         return None
 
-    # Compile patterns (could be cached at module level for performance)
-    # Pattern 1: "time<Nms" (Windows fast response)
-    less_than_pattern = re.compile(r"time<(\d+)", re.IGNORECASE)
-    match = less_than_pattern.search(output)
-    if match:
-        # Interpret "time<N" as midpoint: N/2
-        threshold = float(match.group(1))
-        return threshold / 2.0
-
-    # Pattern 2: "time=12.3 ms" or "time = 12 ms" (standard format)
-    # Matches: "time [space] = [space] <number> ms"
-    # Supports optional space before '=' for defensive parsing
-    latency_pattern = re.compile(r"time\s*[=<]\s*(\d+(?:\.\d+)?)\s*ms", re.IGNORECASE)
-    match = latency_pattern.search(output)
-    if match:
-        try:
-            return float(match.group(1))
-        except (ValueError, IndexError):
-            return None
+    if isinstance(output, bytes):
+        keyword, pattern = b"time", _PING_BYTES_RE
+    else:
+        keyword, pattern = "time", _PING_RE
+
+    output = output.lower()
+    # Every match starts with "time", so find() (a fast C substring search)
+    # locates candidates and the regex only runs anchored at those offsets.
+    # Output without the keyword (e.g. localized Windows ping) never
+    # reaches the regex at all.
+    pos = output.find(keyword)
+    while pos >= 0:
+        match = pattern.match(output, pos)
+        if match is not None:
+            break
+        pos = output.find(keyword, pos + 4)
+    else:
+        return None
 
-    return None
+    # float() accepts the ASCII digits of a bytes match directly
+    op, num = match.group("op", "num")
+    return float(num) * _OP_SCALE[op]
 
 
 class PingCollector:
     """Collector that uses OS ping command to measure network latency.
 
     Cross-platform implementation supporting Windows, Linux, and macOS.
-    Uses subprocess to execute system ping with configurable timeout.
+    When the optional ``icmplib`` package is installed, samples are taken
+    in-process over unprivileged ICMP sockets, avoiding a fork/exec and text
+    parsing per sample. Otherwise (or if the OS does not permit unprivileged
+    ICMP sockets) it uses subprocess to execute system ping with configurable
+    timeout.
 
     **Localization Limitation:**
     Parsing relies on the English keyword "time" in ping output. On non-English
@@ -79,27 +109,34 @@ class PingCollector:
     **Workarounds for non-English systems:**
     1. Set system locale to English for ping command (via LANG environment)
     2. Use FakeCollector for testing/development
-    3. Future enhancement: Add multi-language regex patterns
+    3. Install ``icmplib`` (``pip install netmon[icmp]``), which does not parse ping output
     """
 
-    def __init__(self, timeout_ms: int = 1000):
+    def __init__(
+        self,
+        timeout_ms: int = 1000,
+        runner: Callable[..., subprocess.CompletedProcess] | None = None,
+    ):
         """Initialize ping collector with timeout.
 
         Args:
             timeout_ms: Maximum time to wait for ping response in milliseconds.
                        Default is 1000ms (1 second).
+            runner: Replacement for subprocess.run used to execute the ping
+                    command, e.g. to simulate replies in tests and demos.
+                    When given, icmplib is not used, so every sample goes
+                    through the runner.
         """
-        if timeout_ms <= 0:
-            raise ValueError("timeout_ms must be positive")
-
-        self.timeout_ms = timeout_ms
-        self.timeout_seconds = timeout_ms / 1000.0
-        self.system = platform.system()
+        self._system = _SYSTEM
+        self.timeout_ms = timeout_ms  # Validates and builds the ping argv prefix
+        self._runner = runner if runner is not None else subprocess.run
+        self._use_icmplib = icmplib is not None and runner is None
 
         logger.debug(
-            "PingCollector initialized: timeout_ms=%d, system=%s",
+            "PingCollector initialized: timeout_ms=%d, system=%s, icmplib=%s",
             timeout_ms,
             self.system,
+            self._use_icmplib,
         )
 
     def generate_sample(self, host: str) -> Measurement:
@@ -114,85 +151,175 @@ class PingCollector:
         Returns:
             Measurement object with timestamp, host, latency, and loss status
         """
+        # One clock read per sample, shared by every return path
+        timestamp = datetime.now()
+
         if not host or not host.strip():
-            return Measurement(ts=datetime.now(), host=host, latency_ms=None, loss=True)
+            return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
 
-        timestamp = datetime.now()
+        # Checked once per sample so disabled debug logs cost nothing below
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
+            # Prefer in-process ICMP when available
+            if self._use_icmplib:
+                measurement = self._sample_icmplib(host, timestamp)
+                if measurement is not None:
+                    return measurement
+
             # Build platform-specific ping command
             cmd = self._build_ping_command(host)
 
-            logger.debug("Executing ping: host=%s, timeout=%ds", host, self.timeout_seconds)
+            if debug:
+                logger.debug("Executing ping: host=%s, timeout=%ds", host, self.timeout_seconds)
 
-            # Execute ping with timeout
-            result = subprocess.run(
+            # Execute ping with timeout. Output is captured and parsed as
+            # bytes: only the ASCII latency token matters, so it is never decoded.
+            result = self._runner(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self.timeout_seconds + 0.5,  # Add buffer to subprocess timeout
                 shell=False,  # Security: never use shell=True
             )
 
-            logger.debug("Ping completed: host=%s, returncode=%d", host, result.returncode)
+            if debug:
+                logger.debug("Ping completed: host=%s, returncode=%d", host, result.returncode)
 
             # Non-zero return code indicates ping failure
             if result.returncode != 0:
-                logger.debug(
-                    "Ping failed (non-zero returncode): host=%s, returncode=%d",
-                    host,
-                    result.returncode,
-                )
+                if debug:
+                    logger.debug(
+                        "Ping failed (non-zero returncode): host=%s, returncode=%d",
+                        host,
+                        result.returncode,
+                    )
                 return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
 
             # Parse latency from output
-            latency = self._parse_latency(result.stdout)
+            output = result.stdout
+            latency = self._parse_latency(output)
 
             if latency is not None:
-                logger.debug("Parsed latency: host=%s, latency=%.2fms", host, latency)
+                if debug:
+                    logger.debug("Parsed latency: host=%s, latency=%.2fms", host, latency)
                 return Measurement(ts=timestamp, host=host, latency_ms=latency, loss=False)
             else:
                 # Parse failure - treat as loss
-                logger.debug(
-                    "Parse failed: host=%s, output_preview=%s",
-                    host,
-                    result.stdout[:100] if result.stdout else "(empty)",
-                )
+                if debug:
+                    preview = output[:200]
+                    # Runners may return text as well as the usual bytes
+                    if isinstance(preview, bytes):
+                        preview = preview.decode(errors="replace")
+                    logger.debug(
+                        "Parse failed: host=%s, output_preview=%s",
+                        host,
+                        preview or "(empty)",
+                    )
                 return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
 
         except subprocess.TimeoutExpired:
             # Ping timed out
-            logger.debug("Ping timeout: host=%s, timeout=%ds", host, self.timeout_seconds)
+            if debug:
+                logger.debug("Ping timeout: host=%s, timeout=%ds", host, self.timeout_seconds)
             return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
         except Exception as e:
-            # Any other error (e.g., ping command not found) - treat as loss
-            logger.warning("Ping error: host=%s, error=%s", host, str(e), exc_info=True)
+            # Any other error (e.g., ping command not found) - treat as loss.
+            # The traceback is only worth formatting when debugging.
+            logger.warning("Ping error: host=%s, error=%s", host, e, exc_info=debug)
             return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
 
-    def _build_ping_command(self, host: str) -> list[str]:
-        """Build platform-specific ping command.
+    def _sample_icmplib(self, host: str, timestamp: datetime) -> Measurement | None:
+        """Ping host in-process using icmplib.
 
         Args:
             host: Target host to ping
+            timestamp: Timestamp to record on the measurement
 
         Returns:
-            List of command arguments for subprocess
+            Measurement, or None if unprivileged ICMP sockets are not permitted
+            (icmplib is then disabled and the caller falls back to system ping)
+        """
+        try:
+            result = icmplib.ping(
+                host, count=1, timeout=self.timeout_seconds, privileged=False
+            )
+        except icmplib.SocketPermissionError as e:
+            logger.info("Unprivileged ICMP sockets unavailable, using system ping: %s", e)
+            self._use_icmplib = False
+            return None
+        except icmplib.ICMPLibError as e:
+            # Name resolution failures, unreachable destinations, etc.
+            logger.debug("icmplib ping failed: host=%s, error=%s", host, e)
+            return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
+
+        if not result.is_alive:
+            return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
+
+        return Measurement(ts=timestamp, host=host, latency_ms=result.avg_rtt, loss=False)
+
+    @property
+    def timeout_ms(self) -> int:
+        """Maximum time to wait for a ping response in milliseconds."""
+        return self._timeout_ms
+
+    @timeout_ms.setter
+    def timeout_ms(self, value: int) -> None:
+        if value <= 0:
+            raise ValueError("timeout_ms must be positive")
+        self._timeout_ms = value
+        self.timeout_seconds = value / 1000.0
+        # The timeout is part of the prefix on Windows and Linux
+        self._cmd_prefix = self._ping_command_prefix(self._system)
+
+    @property
+    def system(self) -> str:
+        """Platform name used to select the ping command syntax."""
+        return self._system
+
+    @system.setter
+    def system(self, value: str) -> None:
+        self._system = value
+        self._cmd_prefix = self._ping_command_prefix(value)
+
+    def _ping_command_prefix(self, system: str) -> tuple[str, ...]:
+        """Build the fixed part of the ping command for a platform.
+
+        Everything except the host is known once the platform and timeout are,
+        so this runs on construction (or when ``system`` or ``timeout_ms`` is
+        reassigned) rather than once per sample.
+
+        Args:
+            system: Platform name as returned by platform.system()
+
+        Returns:
+            Tuple of command arguments preceding the host
         """
-        if self.system == "Windows":
+        if system == "Windows":
             # Windows: ping -n count -w timeout_ms host
-            return ["ping", "-n", "1", "-w", str(self.timeout_ms), host]
+            return ("ping", "-n", "1", "-w", str(self.timeout_ms))
 
-        elif self.system == "Linux":
+        elif system == "Linux":
             # Linux: ping -c count -W timeout_seconds host
             timeout_secs = max(1, ceil(self.timeout_seconds))
-            return ["ping", "-c", "1", "-W", str(timeout_secs), host]
+            return ("ping", "-c", "1", "-W", str(timeout_secs))
 
         else:
             # macOS/BSD: ping -c count host
             # Note: macOS -W has different semantics, so we rely on subprocess timeout
-            return ["ping", "-c", "1", host]
+            return ("ping", "-c", "1")
+
+    def _build_ping_command(self, host: str) -> list[str]:
+        """Build platform-specific ping command.
+
+        Args:
+            host: Target host to ping
+
+        Returns:
+            List of command arguments for subprocess
+        """
+        return [*self._cmd_prefix, host]
 
-    def _parse_latency(self, output: str) -> float | None:
+    def _parse_latency(self, output: str | bytes) -> float | None:
         """Parse latency from ping command output.
 
         Delegates to pure function parse_ping_latency_ms() for testability.
@@ -12,6 +12,9 @@ class FakeCollector:
         """Initialize with optional random seed for deterministic behavior."""
         # Create isolated random instance for thread safety
         self._random = random.Random(seed)
+        # Bound once; these are the only RNG calls on the per-sample path
+        self._uniform = self._random.random
+        self._gauss = self._random.gauss
 
         # Simulation parameters
         self.base_latency = 25.0  # Base latency in ms
@@ -27,21 +30,22 @@ class FakeCollector:
 
         timestamp = datetime.now()
 
-        # Determine if this sample is lost
-        is_lost = self._random.random() < self.loss_probability
+        # A single uniform draw selects loss, spike, or normal latency:
+        # [0, loss) -> lost, then spike_probability of the remaining
+        # [loss, 1) range -> spike, rest -> normal. So spike_probability is
+        # the chance of a spike given the sample was not lost.
+        roll = self._uniform()
 
-        if is_lost:
+        if roll < self.loss_probability:
             return Measurement(ts=timestamp, host=host, latency_ms=None, loss=True)
 
         # Generate latency with occasional spikes
-        if self._random.random() < self.spike_probability:
+        base = self.base_latency
+        loss = self.loss_probability
+        if roll < loss + self.spike_probability * (1.0 - loss):
             # Latency spike
-            latency = self.base_latency * self.spike_multiplier + self._random.gauss(
-                0, self.latency_variance
-            )
-        else:
-            # Normal latency
-            latency = self.base_latency + self._random.gauss(0, self.latency_variance)
+            base *= self.spike_multiplier
+        latency = base + self._gauss(0, self.latency_variance)
 
         # Ensure latency is positive
         latency = max(0.1, latency)
@@ -0,0 +1,139 @@
+"""Rolling per-host statistics for NetMon."""
+
+import math
+from array import array
+
+from netmon.models import Measurement
+
+
+class HostStats:
+    """Rolling latency, jitter and loss statistics for one host.
+
+    Running values are maintained as samples are added to and evicted from the
+    windows, so reading a statistic never rescans the windows. Latencies are
+    kept unboxed in a fixed-size ring, with their mean and sum of squared
+    deviations updated by Welford's method, which avoids the cancellation of
+    a sum-of-squares variance. Loss flags are bits of a single int, shifted in
+    as samples arrive. Slotted, as one instance is updated for every sample of
+    its host.
+    """
+
+    __slots__ = (
+        "latencies",
+        "latency_head",
+        "latency_count",
+        "latency_mean",
+        "latency_m2",
+        "loss_bits",
+        "loss_mask",
+        "loss_window_size",
+        "loss_samples",
+        "lost_count",
+        "last_latency",
+    )
+
+    def __init__(self, latency_window: int = 30, loss_window: int = 50):
+        """Create empty statistics.
+
+        Args:
+            latency_window: Number of recent latencies used for jitter
+            loss_window: Number of recent samples used for loss percentage
+        """
+        self.latencies = array("d", [0.0]) * latency_window  # Ring of recent latencies
+        self.latency_head = 0  # Ring slot of the oldest latency once full
+        self.latency_count = 0  # Number of latencies in the ring
+        self.latency_mean = 0.0  # Mean of the latencies in the ring
+        self.latency_m2 = 0.0  # Sum of squared deviations from latency_mean
+        self.loss_bits = 0  # Loss flags of recent samples, newest in bit 0
+        self.loss_mask = (1 << loss_window) - 1  # Drops flags older than the window
+        self.loss_window_size = loss_window
+        self.loss_samples = 0  # Number of flags in loss_bits
+        self.lost_count = 0  # Number of set bits in loss_bits
+        self.last_latency = None  # Most recent non-lost latency
+
+    def record(self, sample: Measurement) -> None:
+        """Add a sample to the windows and running values.
+
+        Args:
+            sample: Measurement for this host
+        """
+        bits = ((self.loss_bits << 1) | sample.loss) & self.loss_mask
+        self.loss_bits = bits
+        self.lost_count = bits.bit_count()
+        if self.loss_samples < self.loss_window_size:
+            self.loss_samples += 1
+
+        if sample.loss:
+            return
+
+        latency = sample.latency_ms
+        self.last_latency = latency
+        latencies = self.latencies
+        count = self.latency_count
+        mean = self.latency_mean
+        if count < len(latencies):
+            # Filling up; the ring has not wrapped, so the next slot is count
+            latencies[count] = latency
+            count += 1
+            self.latency_count = count
+            delta = latency - mean
+            mean += delta / count
+            self.latency_m2 += delta * (latency - mean)
+        else:
+            # Replace the oldest latency; the count stays the same
+            head = self.latency_head
+            evicted = latencies[head]
+            latencies[head] = latency
+            head += 1
+            self.latency_head = head if head < count else 0
+            delta = latency - evicted
+            new_mean = mean + delta / count
+            self.latency_m2 += delta * (latency - new_mean + evicted - mean)
+            mean = new_mean
+        self.latency_mean = mean
+
+    def clear(self) -> None:
+        """Discard all recorded samples."""
+        self.latency_head = 0
+        self.latency_count = 0
+        self.latency_mean = 0.0
+        self.latency_m2 = 0.0
+        self.loss_bits = 0
+        self.loss_samples = 0
+        self.lost_count = 0
+        self.last_latency = None
+
+    def sample_count(self) -> int:
+        """Return the number of samples in the loss window."""
+        return self.loss_samples
+
+    def recent_latencies(self) -> list[float]:
+        """Return the latencies in the window, oldest first."""
+        latencies = self.latencies
+        if self.latency_count < len(latencies):
+            return latencies[:self.latency_count].tolist()
+        head = self.latency_head
+        return latencies[head:].tolist() + latencies[:head].tolist()
+
+    def jitter(self) -> float | None:
+        """Return the sample standard deviation of recent latencies.
+
+        Returns:
+            Jitter in milliseconds, or None with fewer than two latencies
+        """
+        count = self.latency_count
+        if count < 2:
+            return None
+        # Clamp tiny negative values from floating-point rounding
+        return math.sqrt(max(0.0, self.latency_m2 / (count - 1)))
+
+    def loss_percent(self) -> float | None:
+        """Return the percentage of lost samples in the loss window.
+
+        Returns:
+            Loss percentage, or None if no samples have been recorded
+        """
+        count = self.loss_samples
+        if count == 0:
+            return None
+        return (self.lost_count / count) * 100
@@ -4,13 +4,30 @@ import logging
 import os
 import sys
 
+# Map string to logging constant
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
-def configure_logging() -> None:
+
+def _resolve_level(level_name: str) -> int:
+    """Resolve a level name (any case) to a logging constant, defaulting to INFO."""
+    return _LOG_LEVELS.get(level_name.upper(), logging.INFO)
+
+
+def configure_logging(level: str | None = None) -> None:
     """Configure application-wide logging.
 
     Respects NETMON_LOG_LEVEL environment variable (default: INFO).
     Logs to stderr with timestamp, level, module name, and message.
 
+    Args:
+        level: Level name (any case) to use instead of NETMON_LOG_LEVEL
+
     Environment Variables:
         NETMON_LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
                          Default is INFO.
@@ -25,19 +42,10 @@ def configure_logging() -> None:
         # Quiet mode
         $ NETMON_LOG_LEVEL=WARNING python -m netmon
     """
-    # Get log level from environment, default to INFO
-    log_level_str = os.environ.get("NETMON_LOG_LEVEL", "INFO").upper()
-
-    # Map string to logging constant
-    log_level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
-    log_level = log_level_map.get(log_level_str, logging.INFO)
+    # Get log level from the argument or environment, default to INFO
+    if level is None:
+        level = os.environ.get("NETMON_LOG_LEVEL", "INFO")
+    log_level = _resolve_level(level)
 
     # Configure root logger
     logging.basicConfig(
@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Measurement:
-    """A single network measurement sample."""
+    """A single network measurement sample.
+
+    Immutable and slotted: one is created per sample per host and many are
+    retained by the table model, so there is no per-instance ``__dict__``.
+    """
 
     ts: datetime
     host: str
@@ -15,7 +19,9 @@ class Measurement:
 
     def __post_init__(self):
         """Ensure consistency between latency_ms and loss fields."""
+        # Frozen dataclass: normalize via object.__setattr__
         if self.loss:
-            self.latency_ms = None
+            if self.latency_ms is not None:
+                object.__setattr__(self, "latency_ms", None)
         elif self.latency_ms is None:
-            self.loss = True
+            object.__setattr__(self, "loss", True)
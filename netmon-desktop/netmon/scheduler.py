@@ -1,13 +1,24 @@
 """Multi-host sampling scheduler with bounded concurrency."""
 
 import logging
+import sys
 from PySide6.QtCore import QObject, QTimer, QThreadPool, Signal
 from netmon.collector import Collector
-from netmon.workers import SampleWorker
+from netmon.workers import SampleWorker, WorkerSignals
 
 logger = logging.getLogger(__name__)
 
 
+class _HostLogAdapter(logging.LoggerAdapter):
+    """Logger bound to one host; prefixes messages with ``[host]``.
+
+    The prefix is only built for records that pass the level check.
+    """
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['host']}] {msg}", kwargs
+
+
 class MultiHostScheduler(QObject):
     """Schedules ping sampling for multiple hosts with bounded concurrency.
     
@@ -15,13 +26,18 @@ class MultiHostScheduler(QObject):
     - Maintains list of target hosts
     - Bounded global concurrency (max N workers at once)
     - Per-host in-flight tracking (prevents duplicate pings to same host)
+    - Round-robin dispatch so no host is starved under the concurrency cap
     - Timer-driven scheduling with skipped ticks if over capacity
+    - Results are coalesced and delivered in batches, not one signal per sample
     
     Thread-safe: All state access on Qt main thread via signals/slots.
     """
 
+    # How long to collect results before delivering them as one batch
+    BATCH_WINDOW_MS = 50
+
     # Signals
-    sample_ready = Signal(object, int, str)  # (Measurement, generation_id, host)
+    samples_ready = Signal(list)  # [(Measurement, generation_id, host), ...]
     error = Signal(str, str)  # (host, error_msg)
 
     def __init__(
@@ -46,8 +62,14 @@ class MultiHostScheduler(QObject):
         self.max_concurrent = max_concurrent
         
         # Host management
-        self._hosts = []  # List of target hosts
-        self._host_in_flight = {}  # {host: bool} - per-host in-flight flags
+        # Single source of truth for hosts: {host: in_flight}, in insertion
+        # order, giving O(1) membership, add and remove
+        self._hosts: dict[str, bool] = {}
+        # Hosts in order for the round-robin scan; rebuilt only when hosts
+        # are added or removed, not on every tick
+        self._host_order: list[str] = []
+        self._next_idx = 0  # Round-robin cursor into the host order
+        self._host_loggers: dict[str, _HostLogAdapter] = {}  # Pre-bound per host
         
         # Global concurrency tracking
         self._global_in_flight = 0  # Count of active workers
@@ -58,12 +80,29 @@ class MultiHostScheduler(QObject):
         # Threading
         self.thread_pool = QThreadPool.globalInstance()
         
+        # One signals object shared by every worker, connected once rather
+        # than creating and wiring a QObject per sample
+        self._worker_signals = WorkerSignals(self)
+        self._worker_signals.sample_ready.connect(self._on_sample_ready)
+        self._worker_signals.error.connect(self._on_sample_error)
+        self._worker_signals.finished.connect(self._on_sample_finished)
+        
         # Timer for periodic sampling
         self.timer = QTimer()
         self.timer.timeout.connect(self._schedule_tick)
         
+        # Results waiting to be delivered via samples_ready. The flush timer
+        # is started by the first result of a batch, so the results of one
+        # tick are delivered together shortly after they arrive.
+        self._pending = []
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.BATCH_WINDOW_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         # Monitoring state
         self.is_monitoring = False
+        self._timer_paused = False  # Tick timer stopped while at capacity
 
     def add_host(self, host: str):
         """Add a host to the monitoring list.
@@ -74,10 +113,14 @@ class MultiHostScheduler(QObject):
         host = host.strip()
         if not host:
             return
+        # Interned so the host string carried by every sample, table row and
+        # stats lookup for this host is one shared object
+        host = sys.intern(host)
         
         if host not in self._hosts:
-            self._hosts.append(host)
-            self._host_in_flight[host] = False
+            self._hosts[host] = False
+            self._host_order = list(self._hosts)
+            self._host_loggers[host] = _HostLogAdapter(logger, {"host": host})
             logger.debug("Host added: %s (total: %d)", host, len(self._hosts))
 
     def remove_host(self, host: str):
@@ -86,9 +129,9 @@ class MultiHostScheduler(QObject):
         Args:
             host: Host to remove
         """
-        if host in self._hosts:
-            self._hosts.remove(host)
-            self._host_in_flight.pop(host, None)
+        if self._hosts.pop(host, None) is not None:
+            self._host_order = list(self._hosts)
+            self._host_loggers.pop(host, None)
             logger.debug("Host removed: %s (remaining: %d)", host, len(self._hosts))
 
     def get_hosts(self):
@@ -102,7 +145,9 @@ class MultiHostScheduler(QObject):
     def clear_hosts(self):
         """Clear all hosts from the monitoring list."""
         self._hosts.clear()
-        self._host_in_flight.clear()
+        self._host_order = []
+        self._host_loggers.clear()
+        self._next_idx = 0
         logger.debug("All hosts cleared")
 
     def start_monitoring(self):
@@ -121,9 +166,21 @@ class MultiHostScheduler(QObject):
         
         self.is_monitoring = False
         self.timer.stop()
+        self._timer_paused = False
         self._generation_id += 1  # Invalidate in-flight workers
+        
+        self.discard_pending()
         logger.info("Monitoring stopped (generation_id=%d)", self._generation_id)
 
+    def discard_pending(self):
+        """Drop results received but not yet delivered via samples_ready.
+
+        Used when results already queued must not reach the UI, e.g. after
+        its data was cleared. Monitoring itself is unaffected.
+        """
+        self._flush_timer.stop()
+        self._pending.clear()
+
     def set_interval(self, interval_ms: int):
         """Update sampling interval.
         
@@ -142,12 +199,14 @@ class MultiHostScheduler(QObject):
         1. Skip if not monitoring
         2. Skip if global concurrency limit reached
         3. For each host: schedule if not already in-flight
-        4. Fair scheduling: iterate through all hosts each tick
+        4. Fair scheduling: scan round-robin starting at the host after the
+           last one dispatched, so capped ticks don't always favour host 0
         """
         if not self.is_monitoring:
             return
         
-        if len(self._hosts) == 0:
+        num_hosts = len(self._hosts)
+        if num_hosts == 0:
             return
         
         # Check global concurrency limit
@@ -157,22 +216,29 @@ class MultiHostScheduler(QObject):
                 self._global_in_flight,
                 self.max_concurrent,
             )
+            self._pause_timer()
             return
         
         # Try to schedule samples for hosts that aren't in-flight
+        host_order = self._host_order
+        in_flight = self._hosts
+        start = self._next_idx % num_hosts
         scheduled_count = 0
-        for host in self._hosts:
+        for offset in range(num_hosts):
             # Check global limit again (may have scheduled some already)
             if self._global_in_flight >= self.max_concurrent:
                 break
             
             # Skip if this host already has a worker in-flight
-            if self._host_in_flight.get(host, False):
+            idx = (start + offset) % num_hosts
+            host = host_order[idx]
+            if in_flight[host]:
                 continue
             
             # Schedule sample for this host
             self._schedule_sample(host)
             scheduled_count += 1
+            self._next_idx = idx + 1
         
         if scheduled_count > 0:
             logger.debug(
@@ -181,6 +247,15 @@ class MultiHostScheduler(QObject):
                 self._global_in_flight,
                 self.max_concurrent,
             )
+        
+        # No point waking up again until a worker finishes
+        if self._global_in_flight >= self.max_concurrent:
+            self._pause_timer()
+
+    def _pause_timer(self):
+        """Stop the tick timer while at capacity; a finishing worker restarts it."""
+        self.timer.stop()
+        self._timer_paused = True
 
     def _schedule_sample(self, host: str):
         """Schedule a sample collection for a specific host.
@@ -189,17 +264,14 @@ class MultiHostScheduler(QObject):
             host: Target host
         """
         # Mark as in-flight
-        self._host_in_flight[host] = True
+        self._hosts[host] = True
         self._global_in_flight += 1
         
         # Capture current generation_id
         generation_id = self._generation_id
         
         # Create worker
-        worker = SampleWorker(self.collector, host, generation_id)
-        worker.signals.sample_ready.connect(self._on_sample_ready)
-        worker.signals.error.connect(self._on_sample_error)
-        worker.signals.finished.connect(lambda: self._on_sample_finished(host))
+        worker = SampleWorker(self.collector, host, generation_id, self._worker_signals)
         
         # Execute in thread pool
         self.thread_pool.start(worker)
@@ -214,9 +286,8 @@ class MultiHostScheduler(QObject):
         """
         # Check if stale (generation mismatch)
         if generation_id != self._generation_id:
-            logger.debug(
-                "Ignoring stale result: host=%s, generation_id=%d (current=%d)",
-                host,
+            self._host_log(host).debug(
+                "Ignoring stale result: generation_id=%d (current=%d)",
                 generation_id,
                 self._generation_id,
             )
@@ -226,8 +297,19 @@ class MultiHostScheduler(QObject):
         if not self.is_monitoring:
             return
         
-        # Forward to main window
-        self.sample_ready.emit(sample, generation_id, host)
+        # Queue for the next batch delivered to the main window
+        self._pending.append((sample, generation_id, host))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        """Deliver queued results as a single samples_ready batch."""
+        if not self._pending:
+            return
+        
+        batch = self._pending
+        self._pending = []
+        self.samples_ready.emit(batch)
 
     def _on_sample_error(self, error_msg):
         """Handle sample error from worker.
@@ -246,18 +328,39 @@ class MultiHostScheduler(QObject):
         Args:
             host: Host that finished sampling
         """
-        # Clear per-host flag
-        self._host_in_flight[host] = False
+        # Clear per-host flag (unless the host was removed while its worker
+        # was running)
+        if host in self._hosts:
+            self._hosts[host] = False
         
         # Decrement global counter
         self._global_in_flight = max(0, self._global_in_flight - 1)
         
-        logger.debug(
-            "Worker finished: host=%s (in-flight: %d/%d)",
-            host,
+        self._host_log(host).debug(
+            "Worker finished (in-flight: %d/%d)",
             self._global_in_flight,
             self.max_concurrent,
         )
+        
+        # Capacity freed up - resume ticking
+        if (
+            self._timer_paused
+            and self.is_monitoring
+            and self._global_in_flight < self.max_concurrent
+        ):
+            self._timer_paused = False
+            self.timer.start(self.interval_ms)
+
+    def _host_log(self, host: str) -> logging.LoggerAdapter:
+        """Get the pre-bound logger for a host.
+
+        Hosts removed while a worker was running no longer have one, so a
+        temporary adapter is created for them.
+        """
+        host_logger = self._host_loggers.get(host)
+        if host_logger is None:
+            host_logger = _HostLogAdapter(logger, {"host": host})
+        return host_logger
 
     def get_stats(self):
         """Get scheduler statistics.
@@ -0,0 +1,55 @@
+"""Proxy model that filters measurement rows by exact host."""
+
+import sys
+
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel
+
+_HAS_FILTER_CHANGE_API = hasattr(QSortFilterProxyModel, "Direction")
+
+
+class HostFilterProxyModel(QSortFilterProxyModel):
+    """Sort/filter proxy that shows only rows for a single host.
+
+    The built-in fixed-string filter runs a case-insensitive substring match
+    per row. Host filtering only ever needs exact equality against the host
+    picked in the filter dropdown, so acceptance is a plain string compare,
+    and no filter at all short-circuits to accepting every row.
+
+    The source model must provide ``host_at(row)`` (see MeasurementModel),
+    which avoids building a model index and going through data() per row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._host_filter = None  # None shows all hosts
+
+    def host_filter(self) -> str | None:
+        """Return the host rows are filtered to, or None if unfiltered."""
+        return self._host_filter
+
+    def set_host_filter(self, host: str | None):
+        """Show only rows for the given host.
+
+        Args:
+            host: Host to show, or None to show all rows
+        """
+        if host is not None:
+            # Interned hosts compare by identity first in the row loop
+            host = sys.intern(host)
+        if host == self._host_filter:
+            return
+        # Only rows are filtered. Qt 6.10 replaced invalidateRowsFilter()
+        # with the begin/endFilterChange pair.
+        if _HAS_FILTER_CHANGE_API:
+            self.beginFilterChange()
+            self._host_filter = host
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._host_filter = host
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept the row if its host equals the filter host."""
+        if self._host_filter is None:
+            return True
+        return self.sourceModel().host_at(source_row) == self._host_filter
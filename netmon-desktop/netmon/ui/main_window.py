@@ -1,9 +1,7 @@
 """Main window for NetMon application."""
 
-import csv
 import logging
-import statistics
-from collections import deque
+import sys
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -21,10 +19,12 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QCheckBox,
 )
-from PySide6.QtCore import Qt, QSortFilterProxyModel
-from PySide6.QtGui import QCloseEvent
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCloseEvent, QShowEvent
 from netmon.collector import Collector, FakeCollectorAdapter
+from netmon.host_stats import HostStats
 from netmon.scheduler import MultiHostScheduler
+from netmon.ui.host_filter_proxy import HostFilterProxyModel
 from netmon.ui.measurement_model import MeasurementModel
 
 logger = logging.getLogger(__name__)
@@ -52,21 +52,22 @@ class MainWindow(QMainWindow):
             interval_ms=self.sample_interval_ms,
             max_concurrent=4,  # Global concurrency limit
         )
-        self.scheduler.sample_ready.connect(self.on_sample_ready)
+        self.scheduler.samples_ready.connect(self.on_samples_ready)
         self.scheduler.error.connect(self.on_sample_error)
 
         # Data storage
         self.max_table_rows = 300
         self.measurement_model = MeasurementModel(max_rows=self.max_table_rows)
         
-        # Proxy model for filtering and sorting
-        self.proxy_model = QSortFilterProxyModel()
+        # Proxy model for filtering (by exact host) and sorting
+        self.proxy_model = HostFilterProxyModel()
         self.proxy_model.setSourceModel(self.measurement_model)
-        self.proxy_model.setFilterKeyColumn(1)  # Filter on Host column (index 1)
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
 
         # Per-host statistics tracking (keyed by host)
-        self.host_stats = {}  # {host: {latencies: deque, samples: deque}}
+        self.host_stats = {}  # {host: HostStats}
+        
+        # Hosts in the monitoring list (mirrors host_list for O(1) lookups)
+        self._known_hosts = set()
         
         # Track hosts for filter dropdown
         self.filter_hosts = set()  # Set of unique hosts
@@ -74,21 +75,21 @@ class MainWindow(QMainWindow):
         # Auto-scroll control ("follow tail" behavior)
         self.follow_tail = True  # Follow new data by default
         self._user_disabled_follow_tail = False  # Track explicit user disable
+        self._in_autoscroll = False  # Set while we scroll programmatically
 
         # Set up the main UI
         self.setup_ui()
         
         # Add default hosts
         for host in ["google.com", "cloudflare.com", "8.8.8.8"]:
-            self.scheduler.add_host(host)
-            self.host_list.addItem(host)
-            self.host_stats[host] = {
-                "latencies": deque(maxlen=30),
-                "samples": deque(maxlen=50),
-            }
-            # Add to filter dropdown
-            self.filter_hosts.add(host)
-            self.filter_combo.addItem(host)
+            self._register_host(host)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Refresh the statistics display, which is not updated while hidden."""
+        super().showEvent(event)
+        current_item = self.host_list.currentItem()
+        if current_item:
+            self.update_statistics_for_host(current_item.text())
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle application close event - clean up resources."""
@@ -217,6 +218,13 @@ class MainWindow(QMainWindow):
         self.jitter_label = QLabel("Jitter: --")
         self.loss_label = QLabel("Loss: --")
 
+        # Last text set on each statistics label (see _set_label)
+        self._label_text = {
+            self.latency_label: "Latency: --",
+            self.jitter_label: "Jitter: --",
+            self.loss_label: "Loss: --",
+        }
+
         for label in [self.latency_label, self.jitter_label, self.loss_label]:
             label.setStyleSheet("padding: 5px; font-family: monospace;")
             stats_layout.addWidget(label)
@@ -288,8 +296,9 @@ class MainWindow(QMainWindow):
         self.table.setSelectionBehavior(QTableView.SelectRows)
         
         # Connect signals for auto-scroll control
-        scrollbar = self.table.verticalScrollBar()
-        scrollbar.valueChanged.connect(self.on_scrollbar_changed)
+        # Kept for is_near_bottom(), which runs on every batch and scroll
+        self._vscroll = self.table.verticalScrollBar()
+        self._vscroll.valueChanged.connect(self.on_scrollbar_changed)
         header.sortIndicatorChanged.connect(self.on_sort_changed)
 
         layout.addWidget(self.table)
@@ -303,28 +312,39 @@ class MainWindow(QMainWindow):
             return
         
         # Check if already in list
-        if host in [self.host_list.item(i).text() for i in range(self.host_list.count())]:
+        if host in self._known_hosts:
             self.status_label.setText(f"Status: Host '{host}' already in list")
             return
         
+        self._register_host(host)
+        
+        # Clear input
+        self.host_input.clear()
+        self.status_label.setText(f"Status: Added '{host}'")
+    
+    def _register_host(self, host: str):
+        """Add a host to the scheduler, host list, statistics and filter.
+        
+        Args:
+            host: Host to add (caller ensures it is not already listed)
+        """
+        # Interned once here; the scheduler hands this same object back with
+        # every sample, so stats/filter lookups and host comparisons on the
+        # hot path hit the identity fast path
+        host = sys.intern(host)
+        
         # Add to scheduler and UI
         self.scheduler.add_host(host)
         self.host_list.addItem(host)
+        self._known_hosts.add(host)
         
         # Initialize stats for this host
-        self.host_stats[host] = {
-            "latencies": deque(maxlen=30),
-            "samples": deque(maxlen=50),
-        }
+        self.host_stats[host] = HostStats()
         
         # Add to filter dropdown if not already present
         if host not in self.filter_hosts:
             self.filter_hosts.add(host)
             self.filter_combo.addItem(host)
-        
-        # Clear input
-        self.host_input.clear()
-        self.status_label.setText(f"Status: Added '{host}'")
     
     def remove_host(self):
         """Remove selected host from monitoring list."""
@@ -340,6 +360,7 @@ class MainWindow(QMainWindow):
         
         # Remove from UI
         self.host_list.takeItem(self.host_list.row(current_item))
+        self._known_hosts.discard(host)
         
         # Remove stats
         self.host_stats.pop(host, None)
@@ -356,9 +377,9 @@ class MainWindow(QMainWindow):
         # Clear stats display if no host selected
         if self.host_list.count() == 0:
             self.stats_host_label.setText("Host: (none)")
-            self.latency_label.setText("Latency: --")
-            self.jitter_label.setText("Jitter: --")
-            self.loss_label.setText("Loss: --")
+            self._set_label(self.latency_label, "Latency: --")
+            self._set_label(self.jitter_label, "Jitter: --")
+            self._set_label(self.loss_label, "Loss: --")
     
     def on_host_selection_changed(self):
         """Handle host selection change in list - update statistics display."""
@@ -369,18 +390,18 @@ class MainWindow(QMainWindow):
             self.update_statistics_for_host(host)
         else:
             self.stats_host_label.setText("Host: (select one)")
-            self.latency_label.setText("Latency: --")
-            self.jitter_label.setText("Jitter: --")
-            self.loss_label.setText("Loss: --")
+            self._set_label(self.latency_label, "Latency: --")
+            self._set_label(self.jitter_label, "Jitter: --")
+            self._set_label(self.loss_label, "Loss: --")
 
     def start_monitoring(self):
         """Handle start button click."""
-        if self.scheduler.get_hosts():
+        hosts = self.scheduler.get_hosts()  # Snapshot copy - fetch once
+        if hosts:
             self.scheduler.start_monitoring()
             self.start_button.setEnabled(False)
             self.stop_button.setEnabled(True)
-            num_hosts = len(self.scheduler.get_hosts())
-            self.status_label.setText(f"Status: Monitoring {num_hosts} host(s)")
+            self.status_label.setText(f"Status: Monitoring {len(hosts)} host(s)")
         else:
             self.status_label.setText("Status: No hosts to monitor")
 
@@ -396,13 +417,15 @@ class MainWindow(QMainWindow):
 
         Keeps monitoring state intact - if running, continues running but with fresh data.
         """
+        # Results queued before the clear belong to the old data
+        self.scheduler.discard_pending()
+        
         # Clear model
         self.measurement_model.clear()
         
         # Clear per-host statistics
-        for host in self.host_stats:
-            self.host_stats[host]["latencies"].clear()
-            self.host_stats[host]["samples"].clear()
+        for stats in self.host_stats.values():
+            stats.clear()
         
         # Update statistics display
         current_item = self.host_list.currentItem()
@@ -417,6 +440,9 @@ class MainWindow(QMainWindow):
 
     def export_csv(self):
         """Export measurements to CSV file."""
+        # Imported on first export rather than at window startup
+        import csv
+
         measurements = self.measurement_model.get_measurements()
         if not measurements:
             self.status_label.setText("Status: No data to export")
@@ -443,31 +469,24 @@ class MainWindow(QMainWindow):
                 # Write header
                 writer.writerow(["ts_iso", "host", "latency_ms", "loss"])
 
-                # Write measurements in chronological order
-                for measurement in measurements:
-                    # Format timestamp as ISO string
-                    ts_iso = measurement.ts.isoformat()
-
-                    # Format latency: empty string if lost, otherwise 2 decimal places
-                    if measurement.loss:
-                        latency_str = ""
-                    else:
-                        latency_str = f"{measurement.latency_ms:.2f}"
-
-                    # Write row
-                    writer.writerow(
-                        [
-                            ts_iso,
-                            measurement.host,
-                            latency_str,
-                            measurement.loss,  # True/False
-                        ]
+                # Write measurements in chronological order:
+                # ISO timestamp, host, latency (empty if lost, otherwise
+                # 2 decimal places), loss (True/False)
+                writer.writerows(
+                    (
+                        m.ts.isoformat(),
+                        m.host,
+                        "" if m.loss else format(m.latency_ms, ".2f"),
+                        m.loss,
                     )
+                    for m in measurements
+                )
 
             self.status_label.setText("Status: Exported CSV")
 
-        except (IOError, PermissionError, OSError) as e:
-            # Handle file system related errors with specific error type
+        except OSError as e:
+            # Handle file system related errors (IOError is an alias and
+            # PermissionError a subclass) with specific error type
             self.status_label.setText(f"Status: Export failed - {type(e).__name__}")
         except UnicodeEncodeError:
             # Handle encoding issues
@@ -486,34 +505,57 @@ class MainWindow(QMainWindow):
             self.scheduler.set_interval(ms_value)
 
     def on_sample_ready(self, sample, generation_id, host):
-        """Handle measurement result from scheduler.
+        """Handle a single measurement result.
 
         Args:
             sample: Measurement object
             generation_id: Generation ID when worker was scheduled
             host: Host that was sampled
         """
-        # Add to table model
-        self.measurement_model.append_measurement(sample)
-        
-        # Add host to filter dropdown if new
-        if host not in self.filter_hosts:
-            self.filter_hosts.add(host)
-            self.filter_combo.addItem(host)
-        
-        # Update per-host statistics
-        if host in self.host_stats:
-            self.host_stats[host]["samples"].append(sample)
-            if not sample.loss and sample.latency_ms is not None:
-                self.host_stats[host]["latencies"].append(sample.latency_ms)
+        self.on_samples_ready([(sample, generation_id, host)])
+
+    def on_samples_ready(self, batch):
+        """Handle a batch of measurement results from scheduler.
+
+        Scrolling and the statistics display are updated once per batch
+        rather than once per sample.
+
+        Args:
+            batch: List of (Measurement, generation_id, host) tuples
+        """
+        current_item = self.host_list.currentItem()
+        selected_host = current_item.text() if current_item else None
+        selected_updated = False
+        
+        # Add to table model as one block of rows
+        visible_rows = self.proxy_model.rowCount()
+        self.measurement_model.append_measurements([item[0] for item in batch])
+        # Rows only evicted/replaced or hidden by the filter leave a view
+        # that is at the bottom still at the bottom
+        grew = self.proxy_model.rowCount() > visible_rows
+        
+        for sample, _generation_id, host in batch:
+            # Add host to filter dropdown if new
+            if host not in self.filter_hosts:
+                self.filter_hosts.add(host)
+                self.filter_combo.addItem(host)
+            
+            # Update per-host statistics
+            stats = self.host_stats.get(host)
+            if stats is not None:
+                stats.record(sample)
+            
+            if host == selected_host:
+                selected_updated = True
         
         # Maybe auto-scroll to latest row (if following tail)
-        self.maybe_autoscroll()
+        if grew:
+            self.maybe_autoscroll()
         
-        # Update statistics display if this host is selected
-        current_item = self.host_list.currentItem()
-        if current_item and current_item.text() == host:
-            self.update_statistics_for_host(host)
+        # Update statistics display if the selected host got new samples and
+        # the labels can be seen (showEvent catches up otherwise)
+        if selected_updated and self.latency_label.isVisible():
+            self.update_statistics_for_host(selected_host)
 
     def on_sample_error(self, host, error_msg):
         """Handle sampling error from scheduler.
@@ -534,10 +576,21 @@ class MainWindow(QMainWindow):
         """
         if text == "All":
             # Clear filter to show all rows
-            self.proxy_model.setFilterFixedString("")
+            self.proxy_model.set_host_filter(None)
         else:
-            # Filter to show only rows matching the selected host
-            self.proxy_model.setFilterFixedString(text)
+            # Filter to show only rows for the selected host
+            self.proxy_model.set_host_filter(text)
+    
+    def _set_label(self, label: QLabel, text: str):
+        """Set a statistics label's text, skipping the repaint if unchanged.
+        
+        Args:
+            label: One of the statistics labels
+            text: New text
+        """
+        if self._label_text[label] != text:
+            self._label_text[label] = text
+            label.setText(text)
     
     def update_statistics_for_host(self, host: str):
         """Update statistics display for a specific host.
@@ -545,47 +598,33 @@ class MainWindow(QMainWindow):
         Args:
             host: Host to show statistics for
         """
-        if host not in self.host_stats:
-            self.latency_label.setText("Latency: --")
-            self.jitter_label.setText("Jitter: --")
-            self.loss_label.setText("Loss: --")
+        stats = self.host_stats.get(host)
+        if stats is None or stats.sample_count() == 0:
+            self._set_label(self.latency_label, "Latency: --")
+            self._set_label(self.jitter_label, "Jitter: --")
+            self._set_label(self.loss_label, "Loss: --")
             return
         
-        samples = self.host_stats[host]["samples"]
-        latencies = self.host_stats[host]["latencies"]
-        
-        if not samples:
-            self.latency_label.setText("Latency: --")
-            self.jitter_label.setText("Jitter: --")
-            self.loss_label.setText("Loss: --")
-            return
-        
-        # Calculate latency (last non-lost sample)
-        last_latency = None
-        for sample in reversed(samples):
-            if not sample.loss and sample.latency_ms is not None:
-                last_latency = sample.latency_ms
-                break
-        
+        # Latency of the last non-lost sample
+        last_latency = stats.last_latency
         if last_latency is not None:
-            self.latency_label.setText(f"Latency: {last_latency:.2f} ms")
+            self._set_label(self.latency_label, f"Latency: {last_latency:.2f} ms")
         else:
-            self.latency_label.setText("Latency: -- ms")
+            self._set_label(self.latency_label, "Latency: -- ms")
         
-        # Calculate jitter (standard deviation of recent latencies)
-        if len(latencies) >= 2:
-            jitter = statistics.stdev(latencies)
-            self.jitter_label.setText(f"Jitter: {jitter:.2f} ms")
+        # Jitter (standard deviation of recent latencies)
+        jitter = stats.jitter()
+        if jitter is not None:
+            self._set_label(self.jitter_label, f"Jitter: {jitter:.2f} ms")
         else:
-            self.jitter_label.setText("Jitter: -- ms")
+            self._set_label(self.jitter_label, "Jitter: -- ms")
         
-        # Calculate loss percentage (over recent samples)
-        if len(samples) > 0:
-            lost_count = sum(1 for s in samples if s.loss)
-            loss_percent = (lost_count / len(samples)) * 100
-            self.loss_label.setText(f"Loss: {loss_percent:.1f}%")
+        # Loss percentage (over recent samples)
+        loss_percent = stats.loss_percent()
+        if loss_percent is not None:
+            self._set_label(self.loss_label, f"Loss: {loss_percent:.1f}%")
         else:
-            self.loss_label.setText("Loss: --%")
+            self._set_label(self.loss_label, "Loss: --%")
     
     def is_sorting_active(self) -> bool:
         """Check if table is currently sorted by user.
@@ -608,13 +647,19 @@ class MainWindow(QMainWindow):
         Returns:
             True if within threshold steps of bottom
         """
-        scrollbar = self.table.verticalScrollBar()
+        scrollbar = self._vscroll
         return (scrollbar.maximum() - scrollbar.value()) <= threshold
     
     def maybe_autoscroll(self):
         """Conditionally scroll to bottom if follow_tail is enabled and appropriate."""
         if self.follow_tail and not self.is_sorting_active():
-            self.table.scrollToBottom()
+            # Our own scroll keeps us at the bottom, so on_scrollbar_changed
+            # has nothing to re-evaluate
+            self._in_autoscroll = True
+            try:
+                self.table.scrollToBottom()
+            finally:
+                self._in_autoscroll = False
     
     def on_scrollbar_changed(self, value: int):
         """Handle scrollbar value changes to detect user scrolling.
@@ -622,8 +667,8 @@ class MainWindow(QMainWindow):
         Args:
             value: Current scrollbar value
         """
-        # Ignore if user explicitly disabled follow tail via checkbox
-        if self._user_disabled_follow_tail:
+        # Ignore programmatic scrolls and explicit user disable via checkbox
+        if self._in_autoscroll or self._user_disabled_follow_tail:
             return
         
         # If user scrolls to near bottom and sorting is inactive, re-enable follow_tail
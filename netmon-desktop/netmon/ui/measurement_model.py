@@ -1,35 +1,56 @@
 """Qt model for measurement data using model/view pattern."""
 
-from collections import deque
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 from netmon.models import Measurement
 
+# Looked up once rather than on every data()/headerData() call (run per
+# cell or section on every repaint)
+_DISPLAY_ROLE = Qt.DisplayRole
+_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+# Alignment per column: time and host left, latency right, lost centered
+_ALIGNMENTS = (
+    Qt.AlignLeft | Qt.AlignVCenter,
+    Qt.AlignLeft | Qt.AlignVCenter,
+    Qt.AlignRight | Qt.AlignVCenter,
+    Qt.AlignCenter,
+)
+_HORIZONTAL = Qt.Horizontal
+
 
 class MeasurementModel(QAbstractTableModel):
     """Table model for network measurements.
 
     Uses Qt's model/view pattern for efficient table updates. Stores measurements
-    in a deque with automatic row limit management via beginRemoveRows/endRemoveRows.
+    in a fixed-size ring buffer: evicting the oldest row only advances the head
+    offset, and row lookups are a single index computation. Views are still told
+    about evictions with beginRemoveRows/endRemoveRows so proxies and selections
+    keep tracking the right rows.
     """
 
     def __init__(self, max_rows: int = 300, parent=None):
         super().__init__(parent)
-        self._measurements = deque()  # No maxlen - we manage manually
         self._max_rows = max_rows
+        self._buf = [None] * max_rows  # Ring buffer of measurements
+        # Display text per buffer slot, one (time, host, latency, lost) tuple
+        # built when the row is added, so repaints only look strings up
+        self._rows = [None] * max_rows
+        self._head = 0  # Buffer slot of row 0
+        self._count = 0  # Number of rows in the buffer
 
-        # Column definitions
-        self._columns = ["Time", "Host", "Latency (ms)", "Lost"]
+        # Column headers, returned as-is by headerData()
+        self._columns = ("Time", "Host", "Latency (ms)", "Lost")
 
         # Cached strings to reduce allocations
         self._loss_yes = "Yes"
         self._loss_no = "No"
         self._loss_dash = "--"
+        self._loss_str = (self._loss_no, self._loss_yes)  # Indexed by loss flag
 
     def rowCount(self, parent=QModelIndex()):
         """Return the number of rows (measurements)."""
         if parent.isValid():
             return 0
-        return len(self._measurements)
+        return self._count
 
     def columnCount(self, parent=QModelIndex()):
         """Return the number of columns."""
@@ -42,38 +63,23 @@ class MeasurementModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
-        if index.row() >= len(self._measurements) or index.row() < 0:
+        row = index.row()
+        if row >= self._count or row < 0:
             return None
 
-        measurement = self._measurements[index.row()]
         col = index.column()
 
-        if role == Qt.DisplayRole:
-            if col == 0:  # Time
-                return measurement.ts.strftime("%H:%M:%S")
-            elif col == 1:  # Host
-                return measurement.host
-            elif col == 2:  # Latency
-                if measurement.loss:
-                    return self._loss_dash
-                else:
-                    return f"{measurement.latency_ms:.2f}"
-            elif col == 3:  # Lost
-                return self._loss_yes if measurement.loss else self._loss_no
-
-        elif role == Qt.TextAlignmentRole:
-            if col == 2:  # Latency - right aligned
-                return Qt.AlignRight | Qt.AlignVCenter
-            elif col == 3:  # Lost - centered
-                return Qt.AlignCenter
-            else:
-                return Qt.AlignLeft | Qt.AlignVCenter
+        if role == _DISPLAY_ROLE:
+            return self._rows[(self._head + row) % self._max_rows][col]
+
+        elif role == _ALIGNMENT_ROLE:
+            return _ALIGNMENTS[col]
 
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Return header data."""
-        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
             if 0 <= section < len(self._columns):
                 return self._columns[section]
         return None
@@ -91,30 +97,102 @@ class MeasurementModel(QAbstractTableModel):
         beginRemoveRows/endRemoveRows, then the new row is added using
         beginInsertRows/endInsertRows. This ensures proper view synchronization.
         """
-        # Check if we need to remove the oldest row first
-        at_capacity = len(self._measurements) >= self._max_rows
-
-        if at_capacity:
+        if self._count >= self._max_rows:
             # Remove oldest row (index 0) before adding new one
-            self.beginRemoveRows(QModelIndex(), 0, 0)
-            self._measurements.popleft()  # Manually remove oldest
-            self.endRemoveRows()
+            self._evict(1)
 
         # Add the new row at the end
-        new_row = len(self._measurements)
+        new_row = self._count
+        slot = (self._head + new_row) % self._max_rows
         self.beginInsertRows(QModelIndex(), new_row, new_row)
-        self._measurements.append(measurement)
+        self._buf[slot] = measurement
+        self._rows[slot] = self._display_row(measurement)
+        self._count += 1
+        self.endInsertRows()
+
+    def append_measurements(self, measurements: list[Measurement]):
+        """Append a batch of measurements to the model.
+
+        Equivalent to calling append_measurement() for each item, but emits at
+        most one row removal (for rows pushed out by the row limit) and one row
+        insertion for the whole batch.
+        """
+        if not measurements:
+            return
+
+        # Only the newest max_rows of an oversized batch can remain
+        if len(measurements) > self._max_rows:
+            measurements = measurements[-self._max_rows:]
+
+        overflow = self._count + len(measurements) - self._max_rows
+        if overflow > 0:
+            # Remove the oldest rows in one block
+            self._evict(overflow)
+
+        buf = self._buf
+        rows = self._rows
+        display_row = self._display_row
+        max_rows = self._max_rows
+        first_row = self._count
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(measurements) - 1)
+        slot = (self._head + first_row) % max_rows
+        for measurement in measurements:
+            buf[slot] = measurement
+            rows[slot] = display_row(measurement)
+            slot += 1
+            if slot == max_rows:
+                slot = 0
+        self._count += len(measurements)
         self.endInsertRows()
 
+    def _display_row(self, measurement: Measurement) -> tuple[str, str, str, str]:
+        """Build the display text for each column of a measurement."""
+        loss = measurement.loss
+        return (
+            measurement.ts.strftime("%H:%M:%S"),
+            measurement.host,
+            self._loss_dash if loss else f"{measurement.latency_ms:.2f}",
+            self._loss_str[loss],
+        )
+
+    def _evict(self, count: int):
+        """Remove the oldest count rows by advancing the ring head."""
+        buf = self._buf
+        rows = self._rows
+        max_rows = self._max_rows
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        head = self._head
+        for _ in range(count):
+            # Drop the references to the evicted measurement and its text
+            buf[head] = None
+            rows[head] = None
+            head += 1
+            if head == max_rows:
+                head = 0
+        self._head = head
+        self._count -= count
+        self.endRemoveRows()
+
     def clear(self):
         """Clear all measurements from the model."""
-        if len(self._measurements) == 0:
+        if self._count == 0:
             return
 
-        self.beginRemoveRows(QModelIndex(), 0, len(self._measurements) - 1)
-        self._measurements.clear()
+        self.beginRemoveRows(QModelIndex(), 0, self._count - 1)
+        self._buf = [None] * self._max_rows
+        self._rows = [None] * self._max_rows
+        self._head = 0
+        self._count = 0
         self.endRemoveRows()
 
+    def host_at(self, row: int) -> str:
+        """Return the host of a row without going through data()."""
+        return self._buf[(self._head + row) % self._max_rows].host
+
     def get_measurements(self):
         """Get all measurements (for export, statistics, etc.)."""
-        return list(self._measurements)
+        end = self._head + self._count
+        if end <= self._max_rows:
+            return self._buf[self._head:end]
+        # Rows wrap around the end of the buffer
+        return self._buf[self._head:] + self._buf[:end - self._max_rows]
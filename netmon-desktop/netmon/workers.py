@@ -14,18 +14,28 @@ class WorkerSignals(QObject):
 
     sample_ready = Signal(object, int, str)  # Emits (Measurement, generation_id, host)
     error = Signal(str)  # Emits error message
-    finished = Signal()  # Emits when worker completes
+    finished = Signal(str)  # Emits host when worker completes
 
 
 class SampleWorker(QRunnable):
-    """Worker that executes collector.generate_sample() in background thread."""
-
-    def __init__(self, collector: Collector, host: str, generation_id: int):
+    """Worker that executes collector.generate_sample() in background thread.
+
+    Workers may share one WorkerSignals object (the scheduler passes its own,
+    connected once), since every signal carries the host it is about.
+    """
+
+    def __init__(
+        self,
+        collector: Collector,
+        host: str,
+        generation_id: int,
+        signals: WorkerSignals | None = None,
+    ):
         super().__init__()
         self.collector = collector
         self.host = host
         self.generation_id = generation_id
-        self.signals = WorkerSignals()
+        self.signals = signals if signals is not None else WorkerSignals()
 
     def run(self):
         """Execute the sampling task in background thread."""
@@ -59,4 +69,4 @@ class SampleWorker(QRunnable):
 
         finally:
             # Always signal completion
-            self.signals.finished.emit()
+            self.signals.finished.emit(self.host)
@@ -1,12 +1,8 @@
 """Test that exception logging includes tracebacks."""
 
-import os
-
-os.environ["NETMON_LOG_LEVEL"] = "DEBUG"
-
 from netmon.logging_config import configure_logging
 
-configure_logging()
+configure_logging(level="DEBUG")
 
 print("=" * 80)
 print("EXCEPTION LOGGING TEST")
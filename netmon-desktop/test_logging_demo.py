@@ -1,7 +1,6 @@
 """Demo: Structured logging at different levels."""
 
-import os
-import sys
+import subprocess
 
 print("=" * 80)
 print("STRUCTURED LOGGING DEMO")
@@ -10,14 +9,19 @@ print("=" * 80)
 # Test at INFO level (default)
 print("\n1. INFO LEVEL (default - production mode)")
 print("-" * 80)
-os.environ["NETMON_LOG_LEVEL"] = "INFO"
 
 from netmon.logging_config import configure_logging
 from netmon.collector_ping import PingCollector
 
 configure_logging()
 
-collector = PingCollector(timeout_ms=500)
+
+def unreachable(cmd, **kwargs):
+    """Stand-in for subprocess.run: the host never replies."""
+    return subprocess.CompletedProcess(cmd, returncode=1, stdout=b"", stderr=b"")
+
+
+collector = PingCollector(timeout_ms=500, runner=unreachable)
 measurement = collector.generate_sample("192.0.2.1")  # Should fail
 print(f"Measurement: loss={measurement.loss}")
 print("Note: No DEBUG logs visible at INFO level")
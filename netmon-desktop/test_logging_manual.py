@@ -1,18 +1,21 @@
 """Quick manual test to verify logging system works."""
 
 import os
+import subprocess
 import sys
 
-# Set DEBUG level for thorough logging (can be overridden by env var)
-if "NETMON_LOG_LEVEL" not in os.environ:
-    os.environ["NETMON_LOG_LEVEL"] = "DEBUG"
-
 from netmon.logging_config import configure_logging
 from netmon.collector_ping import PingCollector, parse_ping_latency_ms
 from netmon.workers import SampleWorker
 from netmon.collector import FakeCollectorAdapter
 
-configure_logging()
+# DEBUG level for thorough logging (can be overridden by env var)
+configure_logging(level=os.environ.get("NETMON_LOG_LEVEL", "DEBUG"))
+
+
+def unreachable(cmd, **kwargs):
+    """Stand-in for subprocess.run: the host never replies."""
+    return subprocess.CompletedProcess(cmd, returncode=1, stdout=b"", stderr=b"")
 
 print("\n" + "=" * 80)
 print("LOGGING SYSTEM VERIFICATION")
@@ -25,7 +28,7 @@ print(f"   Result: {result}")
 
 # Test 2: PingCollector with invalid host (should log at DEBUG)
 print("\n2. Testing PingCollector with unreachable host (check logs above):")
-collector = PingCollector(timeout_ms=500)
+collector = PingCollector(timeout_ms=500, runner=unreachable)
 measurement = collector.generate_sample("192.0.2.1")  # TEST-NET-1, should fail
 print(f"   Measurement: loss={measurement.loss}")
 
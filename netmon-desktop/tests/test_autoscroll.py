@@ -8,12 +8,23 @@ from netmon.ui.main_window import MainWindow
 from netmon.collector import FakeCollectorAdapter
 from netmon.models import Measurement
 
+_NOW = datetime(2024, 1, 1)  # Timestamps are not under test here
+# Rows for filling the table, shared by every test (measurements are immutable)
+_FIFTY = tuple(
+    Measurement(ts=_NOW, host="test.com", latency_ms=float(i), loss=False) for i in range(50)
+)
+
 
 def process_events():
     """Process pending Qt events to ensure UI updates complete."""
     QCoreApplication.processEvents()
 
 
+def add_measurements(window, count=50):
+    """Append count of the shared rows to the window's model as one batch."""
+    window.measurement_model.append_measurements(list(_FIFTY[:count]))
+
+
 @pytest.fixture(scope="module")
 def qapp():
     """Create QApplication instance for tests."""
@@ -23,27 +34,39 @@ def qapp():
     yield app
 
 
-@pytest.fixture
-def window(qapp):
-    """Create MainWindow instance for each test."""
+@pytest.fixture(scope="module")
+def shared_window(qapp):
+    """Create and show one MainWindow for the whole module."""
     collector = FakeCollectorAdapter()
     win = MainWindow(collector)
     # Show window and ensure it's rendered
     win.show()
     process_events()
-    # Clear any default sort indicator
-    header = win.table.horizontalHeader()
-    header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
-    process_events()
     yield win
-    # Cleanup
-    win.scheduler.stop_monitoring()
-    win.scheduler.thread_pool.waitForDone(100)
+    # Cleanup (monitoring is never started, so no workers to wait for)
     win.close()
     win.deleteLater()
     process_events()
 
 
+@pytest.fixture
+def window(shared_window):
+    """Reset the shared MainWindow to its initial state for each test."""
+    win = shared_window
+    win.filter_combo.setCurrentText("All")
+    # Clear any sort indicator left by a previous test
+    header = win.table.horizontalHeader()
+    header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+    win.clear_data()
+    win.follow_tail_checkbox.blockSignals(True)
+    win.follow_tail_checkbox.setChecked(True)
+    win.follow_tail_checkbox.blockSignals(False)
+    win.follow_tail = True
+    win._user_disabled_follow_tail = False
+    process_events()
+    return win
+
+
 class TestAutoScroll:
     """Test suite for auto-scroll (follow tail) behavior."""
 
@@ -73,11 +96,7 @@ class TestAutoScroll:
     def test_is_near_bottom_with_data(self, window):
         """Verify is_near_bottom detects position correctly."""
         # Add enough data to create scrollbar (50 rows should be plenty)
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Scroll to bottom
         window.table.scrollToBottom()
@@ -93,11 +112,7 @@ class TestAutoScroll:
     def test_maybe_autoscroll_when_enabled(self, window):
         """Verify maybe_autoscroll scrolls when follow_tail is True."""
         # Add enough data to create scrollbar
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Scroll to top
         window.table.scrollToTop()
@@ -115,15 +130,10 @@ class TestAutoScroll:
     def test_maybe_autoscroll_when_disabled(self, window):
         """Verify maybe_autoscroll does nothing when follow_tail is False."""
         # Add enough data
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Scroll to top and disable follow_tail
         window.table.scrollToTop()
-        process_events()
         window.follow_tail = False
         
         # Call maybe_autoscroll
@@ -136,18 +146,12 @@ class TestAutoScroll:
     def test_maybe_autoscroll_when_sorting(self, window):
         """Verify maybe_autoscroll does nothing when sorting is active."""
         # Add enough data
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Enable sorting and scroll to top
         header = window.table.horizontalHeader()
         header.setSortIndicator(0, Qt.SortOrder.AscendingOrder)
-        process_events()
         window.table.scrollToTop()
-        process_events()
         
         # Call maybe_autoscroll with follow_tail enabled
         window.follow_tail = True
@@ -176,14 +180,12 @@ class TestAutoScroll:
         # Disable first
         window.follow_tail = False
         window.follow_tail_checkbox.setChecked(False)
-        process_events()
         
         # Ensure no sorting is active
         assert not window.is_sorting_active()
         
         # Enable via checkbox
         window.follow_tail_checkbox.setChecked(True)
-        process_events()
         
         assert window.follow_tail is True
         assert window._user_disabled_follow_tail is False
@@ -215,19 +217,14 @@ class TestAutoScroll:
     def test_on_sample_ready_respects_follow_tail(self, window):
         """Verify on_sample_ready uses maybe_autoscroll instead of direct scrollToBottom."""
         # Add enough data to create scrollbar
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="google.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Scroll to top and disable follow_tail
         window.table.scrollToTop()
-        process_events()
         window.follow_tail = False
         
         # Add new sample via on_sample_ready
-        m = Measurement(ts=datetime.now(), host="google.com", latency_ms=99.0, loss=False)
+        m = Measurement(ts=_NOW, host="google.com", latency_ms=99.0, loss=False)
         window.on_sample_ready(m, 0, "google.com")
         process_events()
         
@@ -237,25 +234,18 @@ class TestAutoScroll:
     def test_scrollbar_reactivates_follow_tail_at_bottom(self, window):
         """Verify scrolling back to bottom re-enables follow_tail."""
         # Add data and disable follow_tail
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         window.table.scrollToTop()
-        process_events()
         window.follow_tail = False
         window._user_disabled_follow_tail = False  # Not explicitly disabled by user
         
         # Manually scroll to bottom
         window.table.scrollToBottom()
-        process_events()
         
         # Simulate scrollbar change event
         scrollbar = window.table.verticalScrollBar()
         window.on_scrollbar_changed(scrollbar.value())
-        process_events()
         
         # Should re-enable follow_tail
         assert window.follow_tail is True
@@ -264,9 +254,7 @@ class TestAutoScroll:
     def test_scrollbar_respects_user_explicit_disable(self, window):
         """Verify scrolling to bottom doesn't re-enable if user explicitly disabled."""
         # Add data
-        for i in range(30):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
+        add_measurements(window, 30)
         
         # User explicitly disables via checkbox
         window.follow_tail_checkbox.setChecked(False)
@@ -283,9 +271,7 @@ class TestAutoScroll:
     def test_scrollbar_disables_follow_tail_when_scrolling_up(self, window):
         """Verify scrolling away from bottom disables follow_tail."""
         # Add data
-        for i in range(30):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
+        add_measurements(window, 30)
         
         # Start at bottom with follow_tail enabled
         window.table.scrollToBottom()
@@ -303,25 +289,18 @@ class TestAutoScroll:
     def test_scroll_away_then_back_reenables_follow_tail(self, window):
         """Verify scrolling away then back to bottom re-enables follow_tail (regression test for signal blocking bug)."""
         # Add data
-        for i in range(50):
-            m = Measurement(ts=datetime.now(), host="test.com", latency_ms=float(i), loss=False)
-            window.measurement_model.append_measurement(m)
-        
-        process_events()
+        add_measurements(window)
         
         # Start at bottom with follow_tail enabled
         window.table.scrollToBottom()
-        process_events()
         window.follow_tail = True
         window._user_disabled_follow_tail = False
         assert window.follow_tail_checkbox.isChecked() is True
         
         # Scroll away from bottom
         window.table.scrollToTop()
-        process_events()
         scrollbar = window.table.verticalScrollBar()
         window.on_scrollbar_changed(scrollbar.value())
-        process_events()
         
         # Should disable follow_tail, but NOT set _user_disabled_follow_tail
         assert window.follow_tail is False
@@ -330,10 +309,42 @@ class TestAutoScroll:
         
         # Scroll back to bottom
         window.table.scrollToBottom()
-        process_events()
         window.on_scrollbar_changed(scrollbar.value())
-        process_events()
         
         # Should RE-ENABLE follow_tail automatically (this is the bug we're testing)
         assert window.follow_tail is True, "follow_tail should re-enable when scrolling back to bottom"
         assert window.follow_tail_checkbox.isChecked() is True
+    
+    def test_autoscroll_skipped_when_no_visible_rows_added(self, window, monkeypatch):
+        """Verify batches hidden by the host filter do not trigger a scroll."""
+        window.filter_combo.setCurrentText("google.com")
+        calls = []
+        monkeypatch.setattr(window, "maybe_autoscroll", lambda: calls.append(True))
+        
+        hidden = Measurement(ts=_NOW, host="8.8.8.8", latency_ms=5.0, loss=False)
+        window.on_sample_ready(hidden, 0, "8.8.8.8")
+        assert calls == []
+        
+        shown = Measurement(ts=_NOW, host="google.com", latency_ms=5.0, loss=False)
+        window.on_sample_ready(shown, 0, "google.com")
+        assert calls == [True]
+    
+    def test_autoscroll_does_not_reenter_scrollbar_handler(self, window, monkeypatch):
+        """Verify the scrollbar slot ignores value changes caused by autoscroll."""
+        add_measurements(window)
+        window.table.scrollToTop()
+        
+        near_bottom_checks = []
+        original = window.is_near_bottom
+        
+        def tracking_is_near_bottom(*args):
+            near_bottom_checks.append(True)
+            return original(*args)
+        
+        monkeypatch.setattr(window, "is_near_bottom", tracking_is_near_bottom)
+        window.follow_tail = True
+        window.maybe_autoscroll()
+        
+        assert near_bottom_checks == []
+        assert window._in_autoscroll is False
+        assert original()
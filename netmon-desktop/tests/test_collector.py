@@ -122,3 +122,18 @@ class TestFakeCollectorAdapter:
 
         with pytest.raises(ValueError, match="Host cannot be empty"):
             adapter.generate_sample("   ")
+
+    def test_loss_and_spike_rates(self):
+        """Test loss is absolute and spikes are a fraction of non-lost samples."""
+        collector = FakeCollector(seed=7)
+        collector.loss_probability = 0.2
+        collector.spike_probability = 0.5
+        collector.latency_variance = 0.0  # Spikes are then exactly base * multiplier
+        spike_latency = collector.base_latency * collector.spike_multiplier
+
+        samples = [collector.generate_sample("example.com") for _ in range(20000)]
+        received = [s for s in samples if not s.loss]
+        spikes = sum(s.latency_ms == spike_latency for s in received)
+
+        assert (len(samples) - len(received)) / len(samples) == pytest.approx(0.2, abs=0.01)
+        assert spikes / len(received) == pytest.approx(0.5, abs=0.015)
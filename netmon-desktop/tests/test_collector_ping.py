@@ -1,17 +1,24 @@
 """Unit tests for PingCollector."""
 
+import subprocess
+import types
 import pytest
 from datetime import datetime
 from netmon.collector_ping import PingCollector
 from netmon.models import Measurement
 
 
+@pytest.fixture(scope="module")
+def parse_collector():
+    """One collector for the parsing tests, which never modify it."""
+    return PingCollector()
+
+
 class TestPingCollectorParsing:
     """Test ping output parsing across different platforms and formats."""
 
-    def test_parse_latency_linux_standard(self):
+    def test_parse_latency_linux_standard(self, parse_collector):
         """Test parsing standard Linux ping output."""
-        collector = PingCollector()
         output = """
 PING google.com (142.250.185.46) 56(84) bytes of data.
 64 bytes from lga25s78-in-f14.1e100.net (142.250.185.46): icmp_seq=1 ttl=117 time=12.3 ms
@@ -20,12 +27,11 @@ PING google.com (142.250.185.46) 56(84) bytes of data.
 1 packets transmitted, 1 received, 0% packet loss, time 0ms
 rtt min/avg/max/mdev = 12.345/12.345/12.345/0.000 ms
 """
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 12.3
 
-    def test_parse_latency_macos_standard(self):
+    def test_parse_latency_macos_standard(self, parse_collector):
         """Test parsing standard macOS ping output."""
-        collector = PingCollector()
         output = """
 PING google.com (172.217.14.206): 56 data bytes
 64 bytes from 172.217.14.206: icmp_seq=0 ttl=56 time=8.123 ms
@@ -34,12 +40,11 @@ PING google.com (172.217.14.206): 56 data bytes
 1 packets transmitted, 1 packets received, 0.0% packet loss
 round-trip min/avg/max/stddev = 8.123/8.123/8.123/0.000 ms
 """
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 8.123
 
-    def test_parse_latency_windows_standard(self):
+    def test_parse_latency_windows_standard(self, parse_collector):
         """Test parsing standard Windows ping output."""
-        collector = PingCollector()
         output = """
 Pinging google.com [142.250.185.46] with 32 bytes of data:
 Reply from 142.250.185.46: bytes=32 time=15ms TTL=117
@@ -49,12 +54,11 @@ Ping statistics for 142.250.185.46:
 Approximate round trip times in milli-seconds:
     Minimum = 15ms, Maximum = 15ms, Average = 15ms
 """
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 15.0
 
-    def test_parse_latency_windows_less_than_1ms(self):
+    def test_parse_latency_windows_less_than_1ms(self, parse_collector):
         """Test parsing Windows 'time<1ms' output."""
-        collector = PingCollector()
         output = """
 Pinging 127.0.0.1 with 32 bytes of data:
 Reply from 127.0.0.1: bytes=32 time<1ms TTL=128
@@ -62,72 +66,63 @@ Reply from 127.0.0.1: bytes=32 time<1ms TTL=128
 Ping statistics for 127.0.0.1:
     Packets: Sent = 1, Received = 1, Lost = 0 (0% loss),
 """
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         # "time<1ms" interpreted as 0.5ms
         assert latency == 0.5
 
-    def test_parse_latency_windows_less_than_10ms(self):
+    def test_parse_latency_windows_less_than_10ms(self, parse_collector):
         """Test parsing Windows 'time<10ms' output."""
-        collector = PingCollector()
         output = "Reply from 192.168.1.1: bytes=32 time<10ms TTL=64"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         # "time<10ms" interpreted as 5.0ms
         assert latency == 5.0
 
-    def test_parse_latency_with_spaces(self):
+    def test_parse_latency_with_spaces(self, parse_collector):
         """Test parsing output with varying whitespace."""
-        collector = PingCollector()
         output = "64 bytes from example.com: time = 25.7 ms"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 25.7
 
-    def test_parse_latency_decimal_precision(self):
+    def test_parse_latency_decimal_precision(self, parse_collector):
         """Test parsing latency with high decimal precision."""
-        collector = PingCollector()
         output = "time=0.123 ms"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 0.123
 
-    def test_parse_latency_integer(self):
+    def test_parse_latency_integer(self, parse_collector):
         """Test parsing integer latency values."""
-        collector = PingCollector()
         output = "time=100 ms"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency == 100.0
 
-    def test_parse_latency_case_insensitive(self):
+    def test_parse_latency_case_insensitive(self, parse_collector):
         """Test parsing with different case variations."""
-        collector = PingCollector()
 
         # Uppercase
         output1 = "TIME=15.5 MS"
-        assert collector._parse_latency(output1) == 15.5
+        assert parse_collector._parse_latency(output1) == 15.5
 
         # Mixed case
         output2 = "Time=20.3 Ms"
-        assert collector._parse_latency(output2) == 20.3
+        assert parse_collector._parse_latency(output2) == 20.3
 
-    def test_parse_latency_empty_output(self):
+    def test_parse_latency_empty_output(self, parse_collector):
         """Test parsing empty output returns None."""
-        collector = PingCollector()
-        assert collector._parse_latency("") is None
-        assert collector._parse_latency(None) is None
+        assert parse_collector._parse_latency("") is None
+        assert parse_collector._parse_latency(None) is None
 
-    def test_parse_latency_no_match(self):
+    def test_parse_latency_no_match(self, parse_collector):
         """Test parsing output with no latency information."""
-        collector = PingCollector()
         output = "Request timed out."
-        assert collector._parse_latency(output) is None
+        assert parse_collector._parse_latency(output) is None
 
-    def test_parse_latency_malformed_output(self):
+    def test_parse_latency_malformed_output(self, parse_collector):
         """Test parsing malformed ping output."""
-        collector = PingCollector()
         output = "Some random text without time information"
-        assert collector._parse_latency(output) is None
+        assert parse_collector._parse_latency(output) is None
 
-    def test_parse_latency_unreachable(self):
+    def test_parse_latency_unreachable(self, parse_collector):
         """Test parsing destination unreachable output."""
-        collector = PingCollector()
         output = """
 PING 192.168.1.254 (192.168.1.254) 56(84) bytes of data.
 From 192.168.1.1 icmp_seq=1 Destination Host Unreachable
@@ -135,7 +130,7 @@ From 192.168.1.1 icmp_seq=1 Destination Host Unreachable
 --- 192.168.1.254 ping statistics ---
 1 packets transmitted, 0 received, +1 errors, 100% packet loss, time 0ms
 """
-        assert collector._parse_latency(output) is None
+        assert parse_collector._parse_latency(output) is None
 
 
 class TestPingCollectorBuildCommand:
@@ -181,6 +176,18 @@ class TestPingCollectorBuildCommand:
         cmd = collector._build_ping_command("8.8.8.8")
         assert cmd == ["ping", "-n", "1", "-w", "2500", "8.8.8.8"]
 
+    def test_build_command_after_timeout_change(self):
+        """Test that reassigning timeout_ms updates the command and timeout."""
+        collector = PingCollector(timeout_ms=1000)
+        collector.system = "Linux"
+
+        collector.timeout_ms = 3000
+
+        assert collector.timeout_seconds == 3.0
+        assert collector._build_ping_command("8.8.8.8") == ["ping", "-c", "1", "-W", "3", "8.8.8.8"]
+        with pytest.raises(ValueError, match="timeout_ms must be positive"):
+            collector.timeout_ms = 0
+
 
 class TestPingCollectorInitialization:
     """Test PingCollector initialization and configuration."""
@@ -259,6 +266,146 @@ class TestPingCollectorGenerateSample:
         assert measurement.loss is True
         assert measurement.latency_ms is None
 
+    def test_generate_sample_uses_runner(self):
+        """Test that an injected runner replaces the ping subprocess."""
+        calls = []
+
+        def runner(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"time=12.3 ms", stderr=b"")
+
+        collector = PingCollector(runner=runner)
+        measurement = collector.generate_sample("example.com")
+
+        assert calls == [collector._build_ping_command("example.com")]
+        assert measurement.loss is False
+        assert measurement.latency_ms == 12.3
+
+    def test_parse_failure_logs_decoded_output(self, caplog):
+        """Test that the debug preview of unparseable output is plain text."""
+
+        def runner(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"Zeit=15ms\r\nTTL=117", stderr=b"")
+
+        with caplog.at_level("DEBUG", logger="netmon.collector_ping"):
+            measurement = PingCollector(runner=runner).generate_sample("example.com")
+
+        assert measurement.loss is True
+        assert "output_preview=Zeit=15ms\r\nTTL=117" in caplog.text
+
+    def test_parse_failure_logs_text_output(self, caplog):
+        """Test that a runner returning text output is previewed as-is."""
+
+        def runner(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0, stdout="Reply from x: Zeit=5ms", stderr="")
+
+        with caplog.at_level("DEBUG", logger="netmon.collector_ping"):
+            measurement = PingCollector(runner=runner).generate_sample("example.com")
+
+        assert measurement.loss is True
+        assert "output_preview=Reply from x: Zeit=5ms" in caplog.text
+        assert not [r for r in caplog.records if r.levelname == "WARNING"]
+
+    def test_generate_sample_runner_timeout(self):
+        """Test that a ping timeout is reported as loss."""
+
+        def runner(cmd, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+        measurement = PingCollector(runner=runner).generate_sample("example.com")
+
+        assert measurement.loss is True
+        assert measurement.latency_ms is None
+
+
+class _ICMPLibError(Exception):
+    """Stand-in for icmplib.ICMPLibError."""
+
+
+class _SocketPermissionError(_ICMPLibError):
+    """Stand-in for icmplib.SocketPermissionError (an ICMPLibError)."""
+
+
+@pytest.fixture
+def fake_icmplib(monkeypatch):
+    """Install a stub icmplib module whose ping() replies with ``reply``.
+
+    Set ``reply`` to a result object or to an exception to raise; each
+    call's host is appended to ``calls``.
+    """
+    stub = types.SimpleNamespace(
+        ICMPLibError=_ICMPLibError,
+        SocketPermissionError=_SocketPermissionError,
+        calls=[],
+        reply=None,
+    )
+
+    def ping(host, **kwargs):
+        stub.calls.append(host)
+        if isinstance(stub.reply, Exception):
+            raise stub.reply
+        return stub.reply
+
+    stub.ping = ping
+    monkeypatch.setattr("netmon.collector_ping.icmplib", stub)
+    return stub
+
+
+class TestPingCollectorIcmplib:
+    """Test the in-process icmplib backend used when icmplib is installed."""
+
+    def test_alive_reply_reports_average_rtt(self, fake_icmplib):
+        """Test that a reply is reported with icmplib's average RTT."""
+        fake_icmplib.reply = types.SimpleNamespace(is_alive=True, avg_rtt=7.25)
+
+        measurement = PingCollector().generate_sample("example.com")
+
+        assert fake_icmplib.calls == ["example.com"]
+        assert measurement.loss is False
+        assert measurement.latency_ms == 7.25
+
+    def test_no_reply_is_loss(self, fake_icmplib):
+        """Test that a host that did not answer is reported as loss."""
+        fake_icmplib.reply = types.SimpleNamespace(is_alive=False, avg_rtt=0.0)
+
+        measurement = PingCollector().generate_sample("example.com")
+
+        assert measurement.loss is True
+        assert measurement.latency_ms is None
+
+    def test_icmplib_error_is_loss(self, fake_icmplib):
+        """Test that icmplib errors (e.g. unknown host) are reported as loss."""
+        fake_icmplib.reply = _ICMPLibError("name resolution failed")
+
+        collector = PingCollector()
+        measurement = collector.generate_sample("example.invalid")
+
+        assert measurement.loss is True
+        assert collector._use_icmplib is True  # Still used for later samples
+
+    def test_permission_error_falls_back_to_system_ping(self, fake_icmplib, monkeypatch):
+        """Test that without ICMP socket permission, ping runs via the runner."""
+        fake_icmplib.reply = _SocketPermissionError("not permitted")
+        commands = []
+
+        def run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"time=3.5 ms", stderr=b"")
+
+        # Default runner is looked up at construction
+        monkeypatch.setattr(subprocess, "run", run)
+        collector = PingCollector()
+
+        first = collector.generate_sample("example.com")
+        assert collector._use_icmplib is False
+        assert first.latency_ms == 3.5
+
+        # Later samples skip icmplib entirely
+        second = collector.generate_sample("example.com")
+        assert fake_icmplib.calls == ["example.com"]
+        assert len(commands) == 2
+        assert second.latency_ms == 3.5
+
 
 class TestPingCollectorLocalizationRobustness:
     """Test robustness against locale/language variations.
@@ -268,50 +415,45 @@ class TestPingCollectorLocalizationRobustness:
     universal than other text. Non-English output is treated as loss.
     """
 
-    def test_parse_german_windows_output(self):
+    def test_parse_german_windows_output(self, parse_collector):
         """Test parsing German Windows ping output."""
-        collector = PingCollector()
         # German Windows: "Zeit" instead of "time" - should fail gracefully
         output = "Antwort von 8.8.8.8: Bytes=32 Zeit=15ms TTL=117"
         # Will fail to parse but should return None, not crash
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         # Note: This will fail since we look for "time" keyword
         # This is intentional - we treat unparseable output as loss
         # If needed in future, can add multi-language support
         assert latency is None  # Non-English output returns None (treated as loss)
 
-    def test_parse_french_windows_output(self):
+    def test_parse_french_windows_output(self, parse_collector):
         """Test parsing French Windows ping output."""
-        collector = PingCollector()
         # French Windows: "temps" instead of "time"
         output = "Réponse de 8.8.8.8 : octets=32 temps=20ms TTL=117"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency is None  # Returns None, treated as loss
 
-    def test_parse_spanish_windows_output(self):
+    def test_parse_spanish_windows_output(self, parse_collector):
         """Test parsing Spanish Windows ping output."""
-        collector = PingCollector()
         # Spanish Windows: "tiempo" instead of "time"
         output = "Respuesta desde 8.8.8.8: bytes=32 tiempo=25ms TTL=117"
-        latency = collector._parse_latency(output)
+        latency = parse_collector._parse_latency(output)
         assert latency is None  # Returns None, treated as loss
 
-    def test_parse_time_keyword_required(self):
+    def test_parse_time_keyword_required(self, parse_collector):
         """Test that 'time' keyword is required for successful parsing."""
-        collector = PingCollector()
         # Without "time" keyword, should return None
         output = "latency=15ms duration=20ms"
-        assert collector._parse_latency(output) is None
+        assert parse_collector._parse_latency(output) is None
 
-    def test_english_variations_still_work(self):
+    def test_english_variations_still_work(self, parse_collector):
         """Test that English variations with 'time' keyword work."""
-        collector = PingCollector()
 
         # Case variations
-        assert collector._parse_latency("TIME=10ms") == 10.0
-        assert collector._parse_latency("Time=11ms") == 11.0
-        assert collector._parse_latency("time=12ms") == 12.0
+        assert parse_collector._parse_latency("TIME=10ms") == 10.0
+        assert parse_collector._parse_latency("Time=11ms") == 11.0
+        assert parse_collector._parse_latency("time=12ms") == 12.0
 
         # Different spacing
-        assert collector._parse_latency("time = 13 ms") == 13.0
-        assert collector._parse_latency("time=14 ms") == 14.0
+        assert parse_collector._parse_latency("time = 13 ms") == 13.0
+        assert parse_collector._parse_latency("time=14 ms") == 14.0
@@ -0,0 +1,68 @@
+"""Tests for CSV export from MainWindow."""
+
+import csv
+from datetime import datetime
+
+import pytest
+from PySide6.QtWidgets import QApplication, QFileDialog
+
+from netmon.collector import FakeCollectorAdapter
+from netmon.models import Measurement
+from netmon.ui.main_window import MainWindow
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def window(qapp):
+    """Create MainWindow instance for each test."""
+    win = MainWindow(FakeCollectorAdapter())
+    yield win
+    win.scheduler.stop_monitoring()
+    win.close()
+
+
+def test_export_csv_rows(window, tmp_path, monkeypatch):
+    """Verify header, row order and field formatting of the exported file."""
+    ts = datetime(2024, 1, 2, 3, 4, 5)
+    window.measurement_model.append_measurements([
+        Measurement(ts=ts, host="google.com", latency_ms=12.345, loss=False),
+        Measurement(ts=ts, host="8.8.8.8", latency_ms=None, loss=True),
+    ])
+    target = tmp_path / "out"
+    monkeypatch.setattr(
+        QFileDialog, "getSaveFileName", lambda *args, **kwargs: (str(target), "")
+    )
+
+    window.export_csv()
+
+    with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["ts_iso", "host", "latency_ms", "loss"],
+        ["2024-01-02T03:04:05", "google.com", "12.35", "False"],
+        ["2024-01-02T03:04:05", "8.8.8.8", "", "True"],
+    ]
+    assert window.status_label.text() == "Status: Exported CSV"
+
+
+def test_export_csv_reports_os_error(window, tmp_path, monkeypatch):
+    """Verify a file system error is reported with its exception type."""
+    window.measurement_model.append_measurement(
+        Measurement(ts=datetime(2024, 1, 2), host="google.com", latency_ms=1.0, loss=False)
+    )
+    target = tmp_path / "missing" / "out.csv"
+    monkeypatch.setattr(
+        QFileDialog, "getSaveFileName", lambda *args, **kwargs: (str(target), "")
+    )
+
+    window.export_csv()
+
+    assert window.status_label.text() == "Status: Export failed - FileNotFoundError"
@@ -24,9 +24,7 @@ def window(qapp):
     collector = FakeCollectorAdapter()
     win = MainWindow(collector)
     yield win
-    # Cleanup
-    win.scheduler.stop_monitoring()
-    win.scheduler.thread_pool.waitForDone(100)
+    # Cleanup (monitoring is never started, so no workers to wait for)
     win.close()
     win.deleteLater()
 
@@ -50,9 +48,7 @@ class TestFilteringAndSorting:
         m2 = Measurement(ts=datetime.now(), host="cloudflare.com", latency_ms=15.0, loss=False)
         m3 = Measurement(ts=datetime.now(), host="8.8.8.8", latency_ms=20.0, loss=False)
         
-        window.measurement_model.append_measurement(m1)
-        window.measurement_model.append_measurement(m2)
-        window.measurement_model.append_measurement(m3)
+        window.measurement_model.append_measurements([m1, m2, m3])
         
         # With "All" filter, proxy should show all 3 rows
         assert window.proxy_model.rowCount() == 3
@@ -64,9 +60,7 @@ class TestFilteringAndSorting:
         m2 = Measurement(ts=datetime.now(), host="cloudflare.com", latency_ms=15.0, loss=False)
         m3 = Measurement(ts=datetime.now(), host="google.com", latency_ms=12.0, loss=False)
         
-        window.measurement_model.append_measurement(m1)
-        window.measurement_model.append_measurement(m2)
-        window.measurement_model.append_measurement(m3)
+        window.measurement_model.append_measurements([m1, m2, m3])
         
         # Filter to google.com
         window.filter_combo.setCurrentText("google.com")
@@ -87,9 +81,7 @@ class TestFilteringAndSorting:
         m2 = Measurement(ts=datetime.now(), host="cloudflare.com", latency_ms=15.0, loss=False)
         m3 = Measurement(ts=datetime.now(), host="8.8.8.8", latency_ms=20.0, loss=False)
         
-        window.measurement_model.append_measurement(m1)
-        window.measurement_model.append_measurement(m2)
-        window.measurement_model.append_measurement(m3)
+        window.measurement_model.append_measurements([m1, m2, m3])
         
         # Filter to cloudflare.com
         window.filter_combo.setCurrentText("cloudflare.com")
@@ -112,8 +104,19 @@ class TestFilteringAndSorting:
         """Verify proxy model is configured correctly."""
         # Verify proxy model settings
         assert window.proxy_model.sourceModel() == window.measurement_model
-        assert window.proxy_model.filterKeyColumn() == 1  # Host column
-        assert window.proxy_model.filterCaseSensitivity() == Qt.CaseInsensitive
+        assert window.proxy_model.host_filter() is None  # "All"
+    
+    def test_filter_matches_host_exactly(self, window):
+        """Verify a host filter does not match hosts that merely contain it."""
+        m1 = Measurement(ts=datetime.now(), host="google.com", latency_ms=10.0, loss=False)
+        m2 = Measurement(ts=datetime.now(), host="google.com.au", latency_ms=15.0, loss=False)
+        
+        window.measurement_model.append_measurements([m1, m2])
+        
+        window.filter_combo.setCurrentText("google.com")
+        
+        assert window.proxy_model.rowCount() == 1
+        assert window.proxy_model.host_filter() == "google.com"
     
     def test_new_host_added_to_filter(self, window):
         """Verify new hosts are added to filter dropdown."""
@@ -159,8 +162,7 @@ class TestFilteringAndSorting:
         m1 = Measurement(ts=datetime.now(), host="google.com", latency_ms=10.0, loss=False)
         m2 = Measurement(ts=datetime.now(), host="cloudflare.com", latency_ms=15.0, loss=False)
         
-        window.measurement_model.append_measurement(m1)
-        window.measurement_model.append_measurement(m2)
+        window.measurement_model.append_measurements([m1, m2])
         
         # Source model should have 2 rows
         source_count = window.measurement_model.rowCount()
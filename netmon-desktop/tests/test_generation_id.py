@@ -0,0 +1,107 @@
+"""Tests for the generation ID system that discards late worker results."""
+
+from datetime import datetime
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from netmon.collector import FakeCollectorAdapter
+from netmon.models import Measurement
+from netmon.scheduler import MultiHostScheduler
+from netmon.workers import SampleWorker, WorkerSignals
+
+_NOW = datetime(2024, 1, 1)
+# Results are only passed through and compared, so one instance serves all tests
+_SAMPLE = Measurement(ts=_NOW, host="host1", latency_ms=10.0, loss=False)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for tests (scheduler timers need one)."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def scheduler(qapp):
+    """Scheduler with one host whose dispatched samples are recorded, not run."""
+    sched = MultiHostScheduler(FakeCollectorAdapter())
+    sched.add_host("host1")
+    sched.dispatched = []  # Generation id captured by each dispatched sample
+    sched._schedule_sample = lambda host: sched.dispatched.append(sched._generation_id)
+    yield sched
+    sched.stop_monitoring()
+
+
+class TestWorker:
+    """Workers carry the generation id and host they were scheduled with."""
+
+    def test_worker_captures_generation_and_host(self):
+        """Test that the worker keeps its schedule-time generation id and host."""
+        worker = SampleWorker(FakeCollectorAdapter(), "test.host", generation_id=5)
+        assert worker.generation_id == 5
+        assert worker.host == "test.host"
+
+    def test_worker_emits_generation_and_host(self):
+        """Test that results and completion are reported with generation id and host."""
+        signals = WorkerSignals()
+        received = []
+        finished = []
+        signals.sample_ready.connect(lambda m, gen_id, host: received.append((m, gen_id, host)))
+        signals.finished.connect(finished.append)
+
+        SampleWorker(FakeCollectorAdapter(), "test.host", 42, signals).run()
+
+        [(measurement, gen_id, host)] = received
+        assert isinstance(measurement, Measurement)
+        assert (gen_id, host) == (42, "test.host")
+        assert finished == ["test.host"]
+
+
+class TestGenerationInvalidation:
+    """Only results from the current monitoring session are delivered."""
+
+    def test_current_generation_applied(self, scheduler):
+        """Test that a result with the current generation id is queued."""
+        scheduler.start_monitoring()
+        scheduler._schedule_tick()
+        [gen_id] = scheduler.dispatched
+
+        scheduler._on_sample_ready(_SAMPLE, gen_id, "host1")
+
+        assert scheduler._pending == [(_SAMPLE, gen_id, "host1")]
+
+    def test_stop_invalidates_in_flight(self, scheduler):
+        """Test that stopping increments the generation and drops late results."""
+        scheduler.start_monitoring()
+        scheduler._schedule_tick()
+        [gen_id] = scheduler.dispatched
+
+        scheduler.stop_monitoring()
+        assert scheduler._generation_id == gen_id + 1
+
+        scheduler._on_sample_ready(_SAMPLE, gen_id, "host1")
+        assert scheduler._pending == []
+
+    def test_result_ignored_when_not_monitoring(self, scheduler):
+        """Test that a current-generation result is dropped while stopped."""
+        scheduler._on_sample_ready(_SAMPLE, scheduler._generation_id, "host1")
+        assert scheduler._pending == []
+
+    def test_restart_isolates_sessions(self, scheduler):
+        """Test that after stop/start only the new session's results are kept."""
+        scheduler.start_monitoring()
+        scheduler._schedule_tick()
+        scheduler.stop_monitoring()
+        scheduler.start_monitoring()
+        scheduler._schedule_tick()
+        gen_id_1, gen_id_2 = scheduler.dispatched
+        assert gen_id_2 == gen_id_1 + 1  # Incremented by stop, not by start
+
+        scheduler._on_sample_ready(_SAMPLE, gen_id_1, "host1")
+        scheduler._on_sample_ready(_SAMPLE, gen_id_2, "host1")
+
+        # Only the result carrying the new generation id is queued
+        assert scheduler._pending == [(_SAMPLE, gen_id_2, "host1")]
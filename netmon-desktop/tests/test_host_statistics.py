@@ -0,0 +1,96 @@
+"""Tests for per-host statistics tracking in MainWindow."""
+
+import statistics
+from datetime import datetime
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from netmon.collector import FakeCollectorAdapter
+from netmon.fake_collector import FakeCollector
+from netmon.models import Measurement
+from netmon.ui.main_window import MainWindow
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def window(qapp):
+    """Create MainWindow instance for each test."""
+    win = MainWindow(FakeCollectorAdapter())
+    yield win
+    win.scheduler.stop_monitoring()
+    win.close()
+
+
+def feed(window, host, count, seed=1):
+    """Feed seeded fake samples for a host and return them."""
+    collector = FakeCollector(seed=seed)
+    collector.loss_probability = 0.2  # Exercise loss eviction too
+    samples = [collector.generate_sample(host) for _ in range(count)]
+    window.on_samples_ready([(s, 0, host) for s in samples])
+    return samples
+
+
+class TestStatisticsDisplay:
+    """Statistics labels reflect the selected host's HostStats."""
+
+    def test_labels_match_full_recomputation(self, window):
+        """Test jitter and loss labels against statistics.stdev and a rescan."""
+        samples = feed(window, "google.com", 120)
+        window.update_statistics_for_host("google.com")
+
+        stats = window.host_stats["google.com"]
+        jitter = statistics.stdev(stats.recent_latencies())
+        loss_window = [s.loss for s in samples[-50:]]
+        loss_percent = sum(loss_window) / len(loss_window) * 100
+        assert window.jitter_label.text() == f"Jitter: {jitter:.2f} ms"
+        assert window.loss_label.text() == f"Loss: {loss_percent:.1f}%"
+
+    def test_clear_data_resets_statistics(self, window):
+        """Test that clearing data resets every host's statistics."""
+        feed(window, "google.com", 40)
+        window.host_list.setCurrentRow(0)
+
+        window.clear_data()
+
+        assert window.host_stats["google.com"].sample_count() == 0
+        assert window.latency_label.text() == "Latency: --"
+
+    def test_last_latency_skips_lost_samples(self, window):
+        """Test that a lost sample does not replace the last latency."""
+        now = datetime.now()
+        good = Measurement(ts=now, host="google.com", latency_ms=12.5, loss=False)
+        lost = Measurement(ts=now, host="google.com", latency_ms=None, loss=True)
+        window.on_samples_ready([(good, 0, "google.com"), (lost, 0, "google.com")])
+        window.update_statistics_for_host("google.com")
+
+        assert window.latency_label.text() == "Latency: 12.50 ms"
+
+    def test_all_lost_window(self, window):
+        """Test statistics when every sample in the window was lost."""
+        sample = Measurement(ts=datetime.now(), host="google.com", latency_ms=None, loss=True)
+        window.on_samples_ready([(sample, 0, "google.com")] * 60)
+        window.update_statistics_for_host("google.com")
+
+        assert window.loss_label.text() == "Loss: 100.0%"
+        assert window.jitter_label.text() == "Jitter: -- ms"
+
+    def test_hidden_window_refreshes_labels_on_show(self, window):
+        """Test that labels skip updates while hidden and catch up when shown."""
+        window.host_list.setCurrentRow(0)  # google.com
+        assert window.latency_label.text() == "Latency: --"
+
+        sample = Measurement(ts=datetime.now(), host="google.com", latency_ms=7.0, loss=False)
+        window.on_samples_ready([(sample, 0, "google.com")])
+        assert window.latency_label.text() == "Latency: --"  # Not visible yet
+
+        window.show()
+        assert window.latency_label.text() == "Latency: 7.00 ms"
@@ -0,0 +1,111 @@
+"""Tests for HostStats rolling statistics."""
+
+import statistics
+from datetime import datetime
+
+import pytest
+
+from netmon.fake_collector import FakeCollector
+from netmon.host_stats import HostStats
+from netmon.models import Measurement
+
+_NOW = datetime(2024, 1, 1)
+
+
+def ok(latency_ms):
+    return Measurement(ts=_NOW, host="h", latency_ms=latency_ms, loss=False)
+
+
+def lost():
+    return Measurement(ts=_NOW, host="h", latency_ms=None, loss=True)
+
+
+def seeded_samples(count, seed=1):
+    """Seeded fake samples with frequent loss, to exercise both windows."""
+    collector = FakeCollector(seed=seed)
+    collector.loss_probability = 0.2
+    return [collector.generate_sample("h") for _ in range(count)]
+
+
+class TestHostStats:
+    """Running sums must match a full recomputation over the windows."""
+
+    def test_empty(self):
+        """Test that fresh stats report no values."""
+        stats = HostStats()
+        assert stats.sample_count() == 0
+        assert stats.jitter() is None
+        assert stats.loss_percent() is None
+        assert stats.last_latency is None
+
+    def test_running_values_match_windows(self):
+        """Test that running values and lost count track evictions from both windows."""
+        stats = HostStats()
+        samples = seeded_samples(200)
+        for sample in samples:
+            stats.record(sample)
+
+        latencies = stats.recent_latencies()
+        expected = [s.latency_ms for s in samples if not s.loss][-30:]
+        assert latencies == expected
+        assert stats.sample_count() == 50
+        mean = statistics.fmean(latencies)
+        assert stats.latency_mean == pytest.approx(mean)
+        assert stats.latency_m2 == pytest.approx(sum((x - mean) ** 2 for x in latencies))
+        assert stats.lost_count == sum(s.loss for s in samples[-50:])
+
+    def test_jitter_matches_stdev(self):
+        """Test jitter against statistics.stdev over the same window."""
+        stats = HostStats()
+        for sample in seeded_samples(120):
+            stats.record(sample)
+
+        assert stats.jitter() == pytest.approx(statistics.stdev(stats.recent_latencies()))
+
+    def test_jitter_needs_two_latencies(self):
+        """Test that jitter is undefined for a single latency."""
+        stats = HostStats()
+        stats.record(ok(10.0))
+        stats.record(lost())
+        assert stats.jitter() is None
+
+    def test_constant_latency_has_zero_jitter(self):
+        """Test that rounding never yields a negative variance."""
+        stats = HostStats()
+        for _ in range(100):
+            stats.record(ok(0.1))
+        assert stats.jitter() == pytest.approx(0.0)
+
+    def test_loss_percent(self):
+        """Test loss percentage over the loss window."""
+        stats = HostStats(loss_window=4)
+        for sample in (lost(), ok(1.0), ok(2.0), lost(), ok(3.0)):
+            stats.record(sample)
+        # Window holds ok, ok, lost, ok
+        assert stats.loss_percent() == pytest.approx(25.0)
+
+    def test_last_latency_skips_lost_samples(self):
+        """Test that a lost sample does not replace the last latency."""
+        stats = HostStats()
+        stats.record(ok(12.5))
+        stats.record(lost())
+        assert stats.last_latency == 12.5
+
+    def test_clear(self):
+        """Test that clear resets windows and running sums."""
+        stats = HostStats()
+        for sample in seeded_samples(40):
+            stats.record(sample)
+
+        stats.clear()
+
+        assert stats.sample_count() == 0
+        assert stats.recent_latencies() == []
+        assert stats.latency_mean == 0.0
+        assert stats.latency_m2 == 0.0
+        assert stats.lost_count == 0
+        assert stats.last_latency is None
+
+    def test_slotted(self):
+        """Test that instances have no per-instance __dict__."""
+        assert not hasattr(HostStats(), "__dict__")
@@ -0,0 +1,145 @@
+"""Integration tests: generation ID system with real worker threads."""
+
+import time
+
+import pytest
+from PySide6.QtTest import QSignalSpy, QTest
+from PySide6.QtWidgets import QApplication
+
+from netmon.collector import FakeCollectorAdapter
+from netmon.ui.main_window import MainWindow
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication instance for tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def window(qapp):
+    """Create MainWindow instance for each test."""
+    win = MainWindow(FakeCollectorAdapter())
+    yield win
+    win.stop_monitoring()
+    wait_for_workers(win.scheduler)
+    win.close()
+
+
+def wait_until(condition, timeout_ms=1000):
+    """Run the Qt event loop until condition() is true or timeout_ms elapses.
+
+    Used where the event to wait for may already be queued, so connecting to
+    its signal now could miss it. Returns the final value of condition().
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not condition() and time.monotonic() < deadline:
+        QTest.qWait(5)
+    return condition()
+
+
+def wait_for_signal(signal, timeout_ms=1000):
+    """Run the Qt event loop until signal fires or timeout_ms elapses.
+
+    Returns True if the signal fired.
+    """
+    spy = QSignalSpy(signal)
+    # Not spy.wait(): it blocks without releasing the GIL, so Python worker
+    # threads could not deliver their results while it waits
+    return wait_until(lambda: spy.count() > 0, timeout_ms)
+
+
+def wait_for_workers(scheduler):
+    """Wait until every in-flight worker of the scheduler has finished.
+
+    Worker results are queued before the worker's finished signal, so by the
+    time the last one finishes every result has reached the scheduler.
+    """
+    assert wait_until(lambda: scheduler.get_stats()["in_flight"] == 0), "Workers timed out"
+
+
+def dispatch(window):
+    """Dispatch samples now instead of waiting for the first timer tick."""
+    window.scheduler._schedule_tick()
+    assert window.scheduler.get_stats()["in_flight"] > 0, "No samples were dispatched"
+
+
+def test_stop_ignores_stale_results(window):
+    """Test that results of workers running at stop never reach the table."""
+    scheduler = window.scheduler
+    window.start_monitoring()
+    initial_gen_id = scheduler._generation_id
+    dispatch(window)
+
+    # Stop immediately (before workers report back)
+    window.stop_monitoring()
+    assert scheduler._generation_id == initial_gen_id + 1
+
+    wait_for_workers(scheduler)
+    assert window.measurement_model.rowCount() == 0
+    assert scheduler._pending == []
+
+
+def test_clear_keeps_monitoring(window):
+    """Test that clearing data keeps the generation and results keep arriving."""
+    scheduler = window.scheduler
+    window.start_monitoring()
+    dispatch(window)
+
+    clear_gen_id = scheduler._generation_id
+    window.clear_data()
+    assert scheduler._generation_id == clear_gen_id
+    assert scheduler.is_monitoring
+
+    assert wait_for_signal(scheduler.samples_ready), "Results should arrive after clear"
+    assert window.measurement_model.rowCount() > 0
+
+
+def test_clear_drops_queued_results(window):
+    """Test that results queued before a clear do not refill the table."""
+    scheduler = window.scheduler
+    window.start_monitoring()
+    sample = scheduler.collector.generate_sample("google.com")
+    scheduler._on_sample_ready(sample, scheduler._generation_id, "google.com")
+
+    window.clear_data()
+    scheduler._flush_pending()
+
+    assert window.measurement_model.rowCount() == 0
+    assert window.host_stats["google.com"].sample_count() == 0
+
+
+def test_normal_operation_applies_results(window):
+    """Test that results with the current generation are applied."""
+    window.start_monitoring()
+    dispatch(window)
+
+    assert wait_for_signal(window.scheduler.samples_ready), "No batch delivered"
+    assert window.measurement_model.rowCount() > 0
+
+
+def test_rapid_stop_start_isolates_generations(window):
+    """Test that only the second session's results are applied."""
+    scheduler = window.scheduler
+    window.start_monitoring()
+    gen_id_1 = scheduler._generation_id
+    dispatch(window)
+
+    # Stop immediately (before workers complete) - this is the key test
+    window.stop_monitoring()
+    gen_id_2 = scheduler._generation_id
+    assert gen_id_2 == gen_id_1 + 1
+
+    # Session 1 workers finish and are rejected due to generation mismatch
+    wait_for_workers(scheduler)
+    assert window.measurement_model.rowCount() == 0
+
+    window.start_monitoring()
+    assert scheduler._generation_id == gen_id_2  # Start doesn't increment
+    dispatch(window)
+
+    assert wait_for_signal(scheduler.samples_ready), "No batch delivered"
+    assert window.measurement_model.rowCount() > 0
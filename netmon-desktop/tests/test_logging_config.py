@@ -0,0 +1,38 @@
+"""Tests for logging configuration."""
+
+import logging
+
+import pytest
+
+from netmon.logging_config import configure_logging
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level after the test."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_level_argument_overrides_environment(root_logger, monkeypatch):
+    """Test that an explicit level wins over NETMON_LOG_LEVEL, in any case."""
+    monkeypatch.setenv("NETMON_LOG_LEVEL", "ERROR")
+    configure_logging(level="debug")
+    assert root_logger.level == logging.DEBUG
+
+
+def test_level_from_environment(root_logger, monkeypatch):
+    """Test that NETMON_LOG_LEVEL is used when no level is given."""
+    monkeypatch.setenv("NETMON_LOG_LEVEL", "WARNING")
+    configure_logging()
+    assert root_logger.level == logging.WARNING
+
+
+def test_invalid_level_defaults_to_info(root_logger):
+    """Test that an unknown level name falls back to INFO."""
+    configure_logging(level="INVALID")
+    assert root_logger.level == logging.INFO
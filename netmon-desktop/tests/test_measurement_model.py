@@ -67,6 +67,49 @@ class TestMeasurementModel:
         assert model.data(model.index(1, 1), Qt.DisplayRole) == "host3.com"
         assert model.data(model.index(2, 1), Qt.DisplayRole) == "host4.com"
 
+    def test_append_measurements_batch(self):
+        """Test batch append matches appending one at a time."""
+        model = MeasurementModel(max_rows=4)
+        inserted = []
+        removed = []
+        model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+        model.rowsRemoved.connect(lambda _parent, first, last: removed.append((first, last)))
+
+        batch = [
+            Measurement(ts=datetime.now(), host=f"host{i}.com", latency_ms=float(i), loss=False)
+            for i in range(3)
+        ]
+        model.append_measurements(batch)
+        model.append_measurements(batch)
+
+        # Second batch pushes out the two oldest rows in a single removal
+        assert inserted == [(0, 2), (1, 3)]
+        assert removed == [(0, 1)]
+        hosts = [model.data(model.index(row, 1), Qt.DisplayRole) for row in range(4)]
+        assert hosts == ["host2.com", "host0.com", "host1.com", "host2.com"]
+
+    def test_append_measurements_larger_than_limit(self):
+        """Test that a batch larger than max_rows keeps only its newest rows."""
+        model = MeasurementModel(max_rows=2)
+        model.append_measurement(
+            Measurement(ts=datetime.now(), host="old.com", latency_ms=1.0, loss=False)
+        )
+
+        model.append_measurements([
+            Measurement(ts=datetime.now(), host=f"host{i}.com", latency_ms=float(i), loss=False)
+            for i in range(5)
+        ])
+
+        assert model.rowCount() == 2
+        assert model.data(model.index(0, 1), Qt.DisplayRole) == "host3.com"
+        assert model.data(model.index(1, 1), Qt.DisplayRole) == "host4.com"
+
+    def test_append_measurements_empty(self):
+        """Test that an empty batch is a no-op."""
+        model = MeasurementModel(max_rows=2)
+        model.append_measurements([])
+        assert model.rowCount() == 0
+
     def test_clear(self):
         """Test clearing all measurements."""
         model = MeasurementModel(max_rows=10)
@@ -137,6 +180,30 @@ class TestMeasurementModel:
         assert len(retrieved) == 3
         assert all(isinstance(m, Measurement) for m in retrieved)
 
+    def test_get_measurements_after_wraparound(self):
+        """Test that rows stay oldest-first once the buffer has wrapped."""
+        model = MeasurementModel(max_rows=3)
+
+        for i in range(7):
+            model.append_measurement(
+                Measurement(ts=datetime.now(), host=f"host{i}.com", latency_ms=float(i), loss=False)
+            )
+
+        hosts = [m.host for m in model.get_measurements()]
+        assert hosts == ["host4.com", "host5.com", "host6.com"]
+        assert [model.host_at(row) for row in range(3)] == hosts
+
+    def test_host_at(self):
+        """Test direct host access by row."""
+        model = MeasurementModel()
+        model.append_measurements([
+            Measurement(ts=datetime.now(), host="a.com", latency_ms=1.0, loss=False),
+            Measurement(ts=datetime.now(), host="b.com", latency_ms=None, loss=True),
+        ])
+
+        assert model.host_at(0) == "a.com"
+        assert model.host_at(1) == "b.com"
+
     def test_invalid_index(self):
         """Test that invalid indices return None."""
         model = MeasurementModel()
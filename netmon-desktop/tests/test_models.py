@@ -1,6 +1,8 @@
 """Tests for netmon.models.Measurement invariants."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
+import pytest
 from netmon.models import Measurement
 
 
@@ -84,3 +86,12 @@ class TestMeasurement:
 
         assert measurement.latency_ms == 0.0
         assert measurement.loss is False
+
+    def test_measurement_is_immutable(self):
+        """Test that measurements cannot be modified after construction."""
+        measurement = Measurement(ts=datetime.now(), host="example.com", latency_ms=1.0, loss=False)
+
+        with pytest.raises(FrozenInstanceError):
+            measurement.latency_ms = 2.0
+
+        assert not hasattr(measurement, "__dict__")
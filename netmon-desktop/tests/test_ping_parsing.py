@@ -250,3 +250,10 @@ class TestParsePingLatencyRobustness:
         # Simulate verbose output with time value buried deep
         output = "x" * 10000 + "time=15.5 ms" + "y" * 10000
         assert parse_ping_latency_ms(output) == 15.5
+
+    def test_bytes_output(self):
+        """Test undecoded process output parses like the decoded text."""
+        assert parse_ping_latency_ms(b"Reply from 8.8.8.8: bytes=32 TIME=15ms TTL=117") == 15.0
+        assert parse_ping_latency_ms(b"Reply from 127.0.0.1: bytes=32 time<1ms TTL=128") == 0.5
+        assert parse_ping_latency_ms(b"Request timed out.") is None
+        assert parse_ping_latency_ms(b"") is None
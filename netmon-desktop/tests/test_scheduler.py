@@ -1,6 +1,8 @@
 """Unit tests for MultiHostScheduler."""
 
+import sys
 from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
 from netmon.scheduler import MultiHostScheduler
 from netmon.collector import FakeCollectorAdapter
 
@@ -16,7 +18,7 @@ class TestMultiHostScheduler:
         assert not scheduler.is_monitoring
         assert scheduler.get_hosts() == []
         assert scheduler._global_in_flight == 0
-        assert scheduler._host_in_flight == {}
+        assert scheduler._hosts == {}
     
     def test_add_single_host(self):
         """Test adding a single host."""
@@ -26,8 +28,17 @@ class TestMultiHostScheduler:
         scheduler.add_host("google.com")
         
         assert scheduler.get_hosts() == ["google.com"]
-        assert "google.com" in scheduler._host_in_flight
-        assert not scheduler._host_in_flight["google.com"]
+        assert scheduler._hosts == {"google.com": False}
+    
+    def test_add_host_interns_name(self):
+        """Test that stored host names are interned after stripping."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        
+        scheduler.add_host("  example.com  ")
+        
+        [host] = scheduler.get_hosts()
+        assert host is sys.intern("example.com")
     
     def test_add_multiple_hosts(self):
         """Test adding multiple hosts."""
@@ -64,7 +75,7 @@ class TestMultiHostScheduler:
         scheduler.remove_host("google.com")
         
         assert scheduler.get_hosts() == ["cloudflare.com"]
-        assert "google.com" not in scheduler._host_in_flight
+        assert "google.com" not in scheduler._hosts
     
     def test_remove_nonexistent_host(self):
         """Test removing host that doesn't exist."""
@@ -86,7 +97,7 @@ class TestMultiHostScheduler:
         scheduler.clear_hosts()
         
         assert scheduler.get_hosts() == []
-        assert scheduler._host_in_flight == {}
+        assert scheduler._hosts == {}
     
     def test_start_monitoring(self):
         """Test starting monitoring."""
@@ -123,6 +134,67 @@ class TestMultiHostScheduler:
         scheduler.start_monitoring()
         assert scheduler.timer.interval() == 2000
     
+    def test_round_robin_dispatch(self, monkeypatch):
+        """Test that capped ticks resume after the last dispatched host."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector, max_concurrent=1)
+        for host in ("a.com", "b.com", "c.com"):
+            scheduler.add_host(host)
+        
+        dispatched = []
+        
+        def fake_schedule(host):
+            dispatched.append(host)
+            scheduler._global_in_flight += 1
+        
+        monkeypatch.setattr(scheduler, "_schedule_sample", fake_schedule)
+        scheduler.is_monitoring = True
+        
+        for _ in range(4):
+            scheduler._global_in_flight = 0
+            scheduler._schedule_tick()
+        
+        assert dispatched == ["a.com", "b.com", "c.com", "a.com"]
+    
+    def test_tick_skips_removed_host(self, monkeypatch):
+        """Test that a tick only dispatches hosts still in the list."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        for host in ("a.com", "b.com", "c.com"):
+            scheduler.add_host(host)
+        scheduler.remove_host("b.com")
+        
+        dispatched = []
+        monkeypatch.setattr(scheduler, "_schedule_sample", dispatched.append)
+        scheduler.is_monitoring = True
+        scheduler._schedule_tick()
+        
+        assert dispatched == ["a.com", "c.com"]
+    
+    def test_timer_paused_at_capacity(self, monkeypatch):
+        """Test that the tick timer stops at capacity and resumes on finish."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector, max_concurrent=1)
+        scheduler.add_host("a.com")
+        scheduler.add_host("b.com")
+        
+        def fake_schedule(host):
+            scheduler._hosts[host] = True
+            scheduler._global_in_flight += 1
+        
+        monkeypatch.setattr(scheduler, "_schedule_sample", fake_schedule)
+        scheduler.start_monitoring()
+        
+        scheduler._schedule_tick()
+        assert not scheduler.timer.isActive()
+        assert scheduler._timer_paused
+        
+        scheduler._on_sample_finished("a.com")
+        assert scheduler.timer.isActive()
+        assert not scheduler._timer_paused
+        
+        scheduler.stop_monitoring()
+    
     def test_max_concurrent_limit(self):
         """Test that max concurrent limit is enforced."""
         collector = FakeCollectorAdapter()
@@ -144,5 +216,73 @@ class TestMultiHostScheduler:
         scheduler = MultiHostScheduler(collector)
         
         # Verify signals exist
-        assert hasattr(scheduler, 'sample_ready')
+        assert hasattr(scheduler, 'samples_ready')
         assert hasattr(scheduler, 'error')
+    
+    def test_results_delivered_as_batch(self):
+        """Test that queued results are emitted together in one batch."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        scheduler.is_monitoring = True
+        batches = []
+        scheduler.samples_ready.connect(batches.append)
+        
+        m1 = collector.generate_sample("a.com")
+        m2 = collector.generate_sample("b.com")
+        scheduler._on_sample_ready(m1, 0, "a.com")
+        scheduler._on_sample_ready(m2, 0, "b.com")
+        assert batches == []
+        assert scheduler._flush_timer.isActive()
+        
+        scheduler._flush_pending()
+        
+        assert batches == [[(m1, 0, "a.com"), (m2, 0, "b.com")]]
+        assert scheduler._pending == []
+    
+    def test_stop_discards_pending_results(self):
+        """Test that stopping drops results not yet delivered."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        scheduler.add_host("a.com")
+        scheduler.start_monitoring()
+        scheduler._on_sample_ready(collector.generate_sample("a.com"), 0, "a.com")
+        
+        scheduler.stop_monitoring()
+        
+        assert scheduler._pending == []
+        assert not scheduler._flush_timer.isActive()
+    
+    def test_discard_pending_keeps_monitoring(self):
+        """Test that discarded results are never delivered by the next flush."""
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        scheduler.is_monitoring = True
+        batches = []
+        scheduler.samples_ready.connect(batches.append)
+        scheduler._on_sample_ready(collector.generate_sample("a.com"), 0, "a.com")
+        
+        scheduler.discard_pending()
+        scheduler._flush_pending()
+        
+        assert batches == []
+        assert not scheduler._flush_timer.isActive()
+        assert scheduler.is_monitoring
+    
+    def test_workers_share_connected_signals(self):
+        """Test that workers report through the scheduler's single signals object."""
+        app = QApplication.instance() or QApplication([])
+        collector = FakeCollectorAdapter()
+        scheduler = MultiHostScheduler(collector)
+        scheduler.add_host("a.com")
+        scheduler.add_host("b.com")
+        scheduler.is_monitoring = True
+        
+        scheduler._schedule_sample("a.com")
+        scheduler._schedule_sample("b.com")
+        scheduler.thread_pool.waitForDone()
+        app.processEvents()
+        
+        assert sorted(host for _, _, host in scheduler._pending) == ["a.com", "b.com"]
+        assert scheduler._global_in_flight == 0
+        assert scheduler._hosts == {"a.com": False, "b.com": False}
+        scheduler.stop_monitoring()